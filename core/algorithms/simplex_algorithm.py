@@ -1,17 +1,23 @@
-from utils import LPProblem, LPResult, BFSolution, SolutionStatus
-from ..simplex_table import SimplexTable
+from typing import Dict, List, Optional, Tuple
+from utils import LPProblem, LPResult, BFSolution, SolutionStatus, PricingRule
+from ..simplex_table import SimplexTable, EPSILON
 import numpy as np
 
 
 class SimplexAlgorithm:
     """Implementation of the Simplex Method for Linear Programming."""
-    def __init__(self, max_iterations: int = 1000):
+    def __init__(self, max_iterations: int = 1000, keep_history: bool = True,
+                 pricing: str = PricingRule.DANTZIG.value):
         """
         Initialize simplex algorithm.
         Args:
             max_iterations: Maximum number of iterations allowed
+            keep_history: Record a table snapshot per iteration (disable for headless solves)
+            pricing: Entering-variable rule, one of PricingRule values ("dantzig" or "devex")
         """
         self.max_iterations = max_iterations
+        self.keep_history = keep_history
+        self.pricing = pricing
         self.iteration_count = 0
         self.table = None
 
@@ -25,16 +31,20 @@ class SimplexAlgorithm:
             LPResult with status, optimal value, solution, and table
         """
         try:
-            self.table = SimplexTable(standard_form, initial_solution)
+            self.table = SimplexTable(
+                standard_form, initial_solution, self.keep_history, self.pricing
+            )
             self.iteration_count = 0
             
-            while not self.table.is_optimal():
+            while True:
+                # no improving column -> optimal
+                entering_col = self.table.get_entering_variable()
+                if entering_col is None:
+                    break
+
                 if self.iteration_count >= self.max_iterations:
                     return self._create_error_result("Max iterations exceeded")
                 
-                entering_col = self.table.get_entering_variable()
-                if entering_col is None: break # idk how we can get here
-                
                 # is unbounded
                 leaving_row = self.table.get_leaving_variable(entering_col)
                 if leaving_row is None:
@@ -45,9 +55,10 @@ class SimplexAlgorithm:
                 self.iteration_count += 1
             
             # check on artificials
-            if initial_solution.artificial_indices:
-                final_solution = self.table.get_solution_vector()
-                art_sum = sum(final_solution[i] for i in initial_solution.artificial_indices)
+            art_ids = initial_solution.artificial_indices
+            if art_ids is not None and art_ids.size:
+                final_solution = np.asarray(self.table.get_solution_vector())
+                art_sum = final_solution[art_ids].sum()
                 if art_sum > 1e-8:
                     return self._create_error_result(
                         "Artificial variables remain in basis (problem is infeasible)"
@@ -58,6 +69,120 @@ class SimplexAlgorithm:
         except Exception as e:
             return self._create_error_result(f"Algorithm error: {str(e)}")
 
+    def solve_batch(self, problems: List[LPProblem], bfs_list: List[BFSolution]) -> List[LPResult]:
+        """
+        Solve many LP problems from their initial BFS.
+        Problems of equal shape are stacked into (B, m, n) arrays and pivoted together,
+        so each NumPy call advances every problem of the group by one iteration.
+        Batched results carry no table (no iteration history is recorded).
+        Args:
+            problems: LPs in standard form (max, Ax=b, x≥0)
+            bfs_list: Initial basic feasible solution of each problem
+        Returns:
+            List of LPResult in the same order as problems
+        """
+        if len(problems) != len(bfs_list):
+            raise ValueError("Expected one initial BFS per problem")
+        # Devex weights are per-problem state; single problems keep their table
+        if len(problems) <= 1 or self.pricing != PricingRule.DANTZIG.value:
+            return [self.solve_from_bfs(p, bfs) for p, bfs in zip(problems, bfs_list)]
+
+        # stackable only with equal A shape and basis length (a Two-Phase BFS may drop redundant rows)
+        groups: Dict[Tuple[Tuple[int, ...], int], List[int]] = {}
+        for k, (problem, bfs) in enumerate(zip(problems, bfs_list)):
+            key = (problem.A_matrix_np.shape, len(bfs.basis_indices))
+            groups.setdefault(key, []).append(k)
+
+        results: List[Optional[LPResult]] = [None] * len(problems)
+        for indices in groups.values():
+            group_problems = [problems[k] for k in indices]
+            group_bfs = [bfs_list[k] for k in indices]
+            try:
+                group_results = self._solve_group(group_problems, group_bfs)
+            except Exception:
+                # one bad problem must not cost the group: solve one by one, errors become results
+                group_results = [self.solve_from_bfs(p, bfs) for p, bfs in zip(group_problems, group_bfs)]
+            for k, result in zip(indices, group_results):
+                results[k] = result
+        return results
+
+    def _solve_group(self, problems: List[LPProblem], bfs_list: List[BFSolution]) -> List[LPResult]:
+        """Dantzig simplex over a stack of equally shaped problems."""
+        A = np.stack([p.A_matrix_np for p in problems]).astype(np.float64)
+        b = np.stack([p.b_vector_np for p in problems]).astype(np.float64)
+        c = np.stack([p.c_vector_np for p in problems])
+        basis = np.stack([bfs.basis_indices for bfs in bfs_list])
+        batch, m, n = A.shape
+        rows = np.arange(batch)
+
+        status = np.full(batch, SolutionStatus.PENDING.value, dtype=object)
+        active = np.ones(batch, dtype=bool)
+
+        for iteration in range(self.max_iterations + 1):
+            # entering column per problem; no improving column -> optimal
+            cB = np.take_along_axis(c, basis, axis=1)
+            delta = c - np.einsum("km,kmn->kn", cB, A)
+            entering = np.argmax(delta, axis=1)
+            optimal = active & (delta[rows, entering] <= EPSILON)
+            status[optimal] = SolutionStatus.OPTIMAL.value
+            active &= ~optimal
+            if not active.any():
+                break
+            if iteration == self.max_iterations:
+                status[active] = SolutionStatus.ERROR.value
+                break
+
+            # min-ratio test per problem; no positive entry -> unbounded
+            column = A[rows, :, entering]
+            positive = column > EPSILON
+            ratios = np.divide(b, column, out=np.full_like(b, np.inf), where=positive)
+            leaving = np.argmin(ratios, axis=1)
+            unbounded = active & ~positive.any(axis=1)
+            status[unbounded] = SolutionStatus.UNBOUNDED.value
+            active &= ~unbounded
+
+            # pivot every still-active problem at once
+            k = np.flatnonzero(active)
+            if k.size == 0:
+                break
+            r, e = leaving[k], entering[k]
+            pivot_element = A[k, r, e]
+            A[k, r, :] /= pivot_element[:, None]
+            b[k, r] /= pivot_element
+            col = A[k, :, e]
+            col[np.arange(k.size), r] = 0.0
+            A[k] -= col[:, :, None] * A[k, r, :][:, None, :]
+            b[k] -= col * b[k, r][:, None]
+            # same residue snap as SimplexTable.pivot, so batch and single solves agree
+            b_k = b[k]
+            b_k[np.abs(b_k) < EPSILON] = 0.0
+            b[k] = b_k
+            basis[k, r] = e
+
+        cB = np.take_along_axis(c, basis, axis=1)
+        values = np.einsum("km,km->k", cB, b)
+        solutions = np.zeros((batch, n))
+        np.put_along_axis(solutions, basis, b, axis=1)
+
+        results = []
+        for i, bfs in enumerate(bfs_list):
+            if status[i] == SolutionStatus.UNBOUNDED.value:
+                results.append(LPResult(status=status[i], error_message="Problem is unbounded"))
+            elif status[i] == SolutionStatus.ERROR.value:
+                results.append(LPResult(status=status[i], error_message="Max iterations exceeded"))
+            elif bfs.artificial_indices is not None and solutions[i, bfs.artificial_indices].sum() > 1e-8:
+                results.append(LPResult(
+                    status=SolutionStatus.ERROR.value,
+                    error_message="Artificial variables remain in basis (problem is infeasible)"
+                ))
+            else:
+                results.append(LPResult(
+                    status=SolutionStatus.OPTIMAL.value,
+                    optimal_value=float(values[i]),
+                    solution=solutions[i, :problems[i].variables_count].tolist()
+                ))
+        return results
+
     def _create_optimal_result(self) -> LPResult:
         """Create result for optimal solution."""
         return LPResult(
@@ -1,4 +1,7 @@
+from functools import lru_cache
+from typing import Tuple
 from utils import LPProblem, BFSolution, IBFSFinder
+import numpy as np
 
 
 class Basic_BFSFinder(IBFSFinder):
@@ -7,15 +10,26 @@ class Basic_BFSFinder(IBFSFinder):
         m = len(standard_form.constraints)
         n = standard_form.variables_count
 
-        basis_indices = list(range(n - m, n))
-        basic_values = [c.free_val for c in standard_form.constraints]
+        basis_indices, basic_values, full_solution = _slack_bfs(
+            n, m, standard_form.b_vector_np.tobytes()
+        )
+        # fresh arrays so callers can't alter the cached entry
+        return BFSolution(
+            basis_indices=basis_indices.copy(),
+            basic_values=basic_values.copy(),
+            full_solution=full_solution.copy()
+        )
 
-        full_solution = [0.0] * n
-        for i, bi in enumerate(basis_indices):
-            full_solution[bi] = basic_values[i]
 
-        return BFSolution(
-            basis_indices=basis_indices,
-            basic_values=basic_values,
-            full_solution=full_solution
-        )
\ No newline at end of file
+@lru_cache(maxsize=256)
+def _slack_bfs(n: int, m: int, b_bytes: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Slack-basis BFS for an (m x n) standard form with RHS b, memoized per shape and b."""
+    basis_indices = np.arange(n - m, n)
+    basic_values = np.frombuffer(b_bytes, dtype=float)
+
+    full_solution = np.zeros(n)
+    full_solution[basis_indices] = basic_values
+
+    for arr in (basis_indices, full_solution):
+        arr.flags.writeable = False
+    return basis_indices, basic_values, full_solution
\ No newline at end of file
@@ -1,5 +1,6 @@
-from utils import LPProblem, BFSolution, IBFSFinder, ConstraintData
-from utils.constants import ConstraintOperator as CO
+from utils import LPProblem, BFSolution, IBFSFinder
+from utils.constants import OperatorCode
+import numpy as np
 
 BIG_M = 1e6
 
@@ -16,52 +17,33 @@ class BigM_BFSFinder(IBFSFinder):
         n = standard_form.variables_count
         total_vars = n + m
 
-        extra_obj = []
-        basis_indices = []
-        new_constraints = []
-        art_ids = []
+        for constraint in standard_form.constraints:
+            if constraint.op_code is None:
+                raise ValueError(f"Unexpected constraint operator: '{constraint.operator.strip()}'")
 
-        for i, constraint in enumerate(standard_form.constraints):
-            col_idx = n + i
-            op = constraint.operator.strip()
+        # one extra unit column per row: slack for '<=', artificial (cost -M) for '>=' and '='
+        needs_artificial = standard_form.operator_codes_np != OperatorCode.LEQ
+        basis_indices = np.arange(n, total_vars)
+        extra_obj = np.where(needs_artificial, -self.big_m, 0.0)
+        b = standard_form.b_vector_np
 
-            extra = [0.0] * m
-            extra[i] = 1.0
-
-            new_coefs = list(constraint.coefficients) + extra
-            new_constraints.append(
-                ConstraintData(new_coefs, CO.EQ.value, constraint.free_val)
-            )
-
-            if op == CO.LEQ.value:
-                extra_obj.append(0.0)
-            elif op in (CO.GEQ.value, CO.EQ.value):
-                extra_obj.append(-self.big_m)
-                art_ids.append(col_idx)
-            else:
-                raise ValueError(f"Unexpected constraint operator: '{op}'")
-
-            basis_indices.append(col_idx)
-
-        augmented = LPProblem(
-            optimization_type=standard_form.optimization_type,
-            objective_coefficients=list(standard_form.objective_coefficients) + extra_obj,
-            constraints=new_constraints,
-            variables_count=total_vars,
+        augmented = LPProblem.from_numpy(
+            np.hstack([standard_form.A_matrix_np, np.eye(m)]), b,
+            np.concatenate([standard_form.c_vector_np, extra_obj]),
+            standard_form.optimization_type
         )
 
-        basic_values = [c.free_val for c in augmented.constraints]
-        full_solution = [0.0] * total_vars
-        for i, bi in enumerate(basis_indices):
-            full_solution[bi] = basic_values[i]
+        full_solution = np.zeros(total_vars)
+        full_solution[basis_indices] = b
 
         standard_form.objective_coefficients = augmented.objective_coefficients
         standard_form.constraints = augmented.constraints
         standard_form.variables_count = augmented.variables_count
+        standard_form.seed_cache(A=augmented.A_matrix_np, b=b, c=augmented.c_vector_np)
 
         return BFSolution(
             basis_indices=basis_indices,
-            basic_values=basic_values,
+            basic_values=b.copy(),
             full_solution=full_solution,
-            artificial_indices=art_ids
+            artificial_indices=basis_indices[needs_artificial]
         )
\ No newline at end of file
@@ -42,10 +42,13 @@ class TwoPhase_BFSFinder(IBFSFinder):
                for i, bi in enumerate(self.phase1_table.basis)):
             return BFSolution(basis_indices=[0], basic_values=[-1.0], full_solution=None)
 
-        # phase1_table back into standard_form
-        for i, constraint in enumerate(standard_form.constraints):
-            constraint.coefficients = list(self.phase1_table.A[i, :n])
-            constraint.free_val = float(self.phase1_table.b[i])
+        # phase1_table back into standard_form; its arrays become the phase 2 cache
+        A = self.phase1_table.A[:, :n].copy()
+        b = self.phase1_table.b.copy()
+        for constraint, row, free_val in zip(standard_form.constraints, A.tolist(), b.tolist()):
+            constraint.coefficients = row
+            constraint.free_val = free_val
+        standard_form.seed_cache(A=A, b=b)
 
         return self._extract_phase2_bfs(self.phase1_table, n)
 
@@ -87,7 +90,7 @@ class TwoPhase_BFSFinder(IBFSFinder):
         basis_indices = []
         art_col = 0
 
-        A = np.array([c.coefficients for c in phase1_problem.constraints], dtype=float)
+        A = phase1_problem.A_matrix_np
 
         for i in range(m):
             if needs_artificial[i]:
@@ -96,10 +99,9 @@ class TwoPhase_BFSFinder(IBFSFinder):
             else:
                 basis_indices.append(self._find_unit_col(A, i, n))
 
-        basic_values = [c.free_val for c in phase1_problem.constraints]
-        full_solution = [0.0] * total
-        for i, bi in enumerate(basis_indices):
-            full_solution[bi] = basic_values[i]
+        basic_values = phase1_problem.b_vector_np.copy()
+        full_solution = np.zeros(total)
+        full_solution[basis_indices] = basic_values
 
         return BFSolution(
             basis_indices=basis_indices,
@@ -110,8 +112,6 @@ class TwoPhase_BFSFinder(IBFSFinder):
     def _run_phase1(self, table: SimplexTable) -> None:
         """Drive the Phase-1 simplex iterations on the given table."""
         for _ in range(self.max_iterations):
-            if table.is_optimal():
-                break
             entering_col = table.get_entering_variable()
             if entering_col is None:
                 break
@@ -136,17 +136,12 @@ class TwoPhase_BFSFinder(IBFSFinder):
 
     def _extract_phase2_bfs(self, table: SimplexTable, n: int) -> BFSolution:
         """Extract a BFSolution for Phase 2, keeping only original variables."""
-        phase2_basis = []
-        phase2_values = []
-
-        for i, bi in enumerate(table.basis):
-            if bi < n:
-                phase2_basis.append(int(bi))
-                phase2_values.append(float(table.b[i]))
+        original = table.basis < n
+        phase2_basis = table.basis[original]
+        phase2_values = table.b[original]
 
-        full_solution = [0.0] * n
-        for bi, val in zip(phase2_basis, phase2_values):
-            full_solution[bi] = val
+        full_solution = np.zeros(n)
+        full_solution[phase2_basis] = phase2_values
 
         return BFSolution(
             basis_indices=phase2_basis,
@@ -156,11 +151,10 @@ class TwoPhase_BFSFinder(IBFSFinder):
 
     def _plain_slack_bfs(self, standard_form: LPProblem, m: int, n: int) -> BFSolution:
         """Fallback: all constraints already have slack basis columns."""
-        basis_indices = list(range(n - m, n))
-        basic_values = [c.free_val for c in standard_form.constraints]
-        full_solution = [0.0] * n
-        for i, bi in enumerate(basis_indices):
-            full_solution[bi] = basic_values[i]
+        basis_indices = np.arange(n - m, n)
+        basic_values = standard_form.b_vector_np.copy()
+        full_solution = np.zeros(n)
+        full_solution[basis_indices] = basic_values
         return BFSolution(
             basis_indices=basis_indices,
             basic_values=basic_values,
@@ -172,7 +166,7 @@ class TwoPhase_BFSFinder(IBFSFinder):
         Detect rows that have no unit-vector basis column among
         the existing variables (i.e. rows from '=' or '>=' constraints).
         """
-        A = np.array([c.coefficients for c in problem.constraints], dtype=float)
+        A = problem.A_matrix_np
         has_basis: List[bool] = [False] * m
         for j in range(n):
             col = A[:, j]
@@ -1,44 +1,60 @@
-from typing import Any, List, Optional
-from utils import ITable
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from utils import ITable, LPProblem, BFSolution, PricingRule
+from scipy.linalg.blas import dger
 import numpy as np
 
 EPSILON = 1e-10
 
 
+@lru_cache(maxsize=None)
+def _make_headers(n: int) -> Tuple[str, ...]:
+    """Simplex table headers for n variables."""
+    return ("X_basis", "ci", "B") + tuple(f"A{i+1}" for i in range(n)) + ("Q",)
+
+
 class SimplexTable(ITable):
     """Concrete table structure for the Simplex algorithm."""
+    def __init__(self, problem: LPProblem, bfs: BFSolution, keep_history: bool = True,
+                 pricing: str = PricingRule.DANTZIG.value):
+        self._delta: Optional[np.ndarray] = None  # reduced costs, reset on pivot
+        self.pricing = pricing
+        super().__init__(problem, bfs, keep_history)
+        self._weights = np.ones(self.A.shape[1])  # Devex reference weights
+        self._col = np.empty(self.A.shape[0])     # pivot column scratch buffer
+        self._cB = np.empty(self.A.shape[0])      # basic costs buffer
+
     def _build_headers(self) -> List[str]:
-        n = self.problem.variables_count
-        return ["X_basis", "ci", "B"] + [f"A{i+1}" for i in range(n)] + ["Q"]
+        return list(_make_headers(self.problem.variables_count))
 
-    def _build_table(self, entering_col: Optional[int] = None) -> List[List[Any]]:
-        """Build the current simplex table with optional Q column."""
-        rows: List[List[Any]] = []
-        
-        Q_values = None
+    def _build_table(self, snapshot: Dict[str, Any]) -> List[List[Any]]:
+        """Render a saved simplex state with optional Q column."""
+        basis, A, b = snapshot["basis"], snapshot["A"], snapshot["b"]
+        entering_col = snapshot["entering_col"]
+        m, n = A.shape
+
+        # one object grid per render: columns X_basis | ci | B | A1..An | Q
+        grid = np.empty((m + 1, n + 4), dtype=object)
+        grid[:, -1] = "-"
         if entering_col is not None:
-            column = self.A[:, entering_col]
-            Q_values = np.full(len(self.b), "-")
+            column = A[:, entering_col]
             positive = column > EPSILON
-            Q_values[positive] = np.round(self.b[positive] / column[positive], 6)
+            grid[:m, -1][positive] = np.round(b[positive] / column[positive], 6)
 
         # basis rows
-        for i, bi in enumerate(self.basis):
-            cb = float(self.c[bi])
-            Ai = self.A[i]
-            Bi = float(self.b[i])
-            
-            q = Q_values[i] if Q_values is not None else "-"
-            row = [f"A{bi + 1}", cb, Bi] + [float(x) for x in Ai] + [q]
-            rows.append(row)
+        cB = self.c[basis]
+        grid[:m, 0] = [f"A{bi + 1}" for bi in basis]
+        grid[:m, 1] = cB
+        grid[:m, 2] = b
+        grid[:m, 3:-1] = A
 
         # delta row
-        delta = self._compute_delta()
-        z0 = self.get_objective_value()
-        footer = ["Δj = cj - zj", "-", z0] + [float(d) for d in delta] + ["-"]
-        rows.append(footer)
-        
-        return rows
+        grid[m, 0] = "Δj = cj - zj"
+        grid[m, 1] = "-"
+        grid[m, 2] = float(cB @ b)
+        grid[m, 3:-1] = self.c - cB @ A
+
+        return grid.tolist()
     
     def is_optimal(self) -> bool:
         """    
@@ -58,25 +74,28 @@ class SimplexTable(ITable):
         """
         Compute reduced costs: delta_j = c_j - z_j
         where z_j = cB^T * A_j
+        Cached until the next pivot.
         """
-        cB = self.c[self.basis]
-        z = cB @ self.A
-        return self.c - z
+        if self._delta is None:
+            np.take(self.c, self.basis, out=self._cB)
+            self._delta = self.c - self._cB @ self.A
+        return self._delta
     
     def get_entering_variable(self) -> Optional[int]:
         """
-        Select entering variable (most positive delta for max).
+        Select entering variable (for max).
+        Dantzig: most positive delta_j.
+        Devex: most positive delta_j^2 / gamma_j among delta_j > 0.
         Returns:
             Column index of entering variable, or None if optimal
         """
         delta = self._compute_delta()
-        
-        positive_indices = np.where(delta > EPSILON)[0]
-        if len(positive_indices) == 0: 
-            return None
-
-        entering_col = positive_indices[np.argmax(delta[positive_indices])]
-        return int(entering_col)
+        if self.pricing == PricingRule.DEVEX.value:
+            scores = np.where(delta > EPSILON, delta ** 2 / self._weights, -np.inf)
+            entering_col = int(np.argmax(scores))
+        else:
+            entering_col = int(np.argmax(delta))
+        return entering_col if delta[entering_col] > EPSILON else None
     
     def get_leaving_variable(self, entering_col: int) -> Optional[int]:
         """
@@ -89,11 +108,11 @@ class SimplexTable(ITable):
         column = self.A[:, entering_col]
 
         positive = column > EPSILON
-        if not np.any(positive):
+        if not positive.any():
             return None
         
-        ratios = np.full(len(self.b), np.inf)
-        ratios[positive] = self.b[positive] / column[positive] # only for positive
+        # divide only where column > 0, the rest stays inf
+        ratios = np.divide(self.b, column, out=np.full(len(self.b), np.inf), where=positive)
         leaving_row = int(np.argmin(ratios))
 
         return leaving_row if ratios[leaving_row] != np.inf else None
@@ -101,8 +120,11 @@ class SimplexTable(ITable):
     def pivot(self, leaving_row: int, entering_col: int) -> None:
         """
         Perform pivot operation using Gauss-Jordan elimination.
-        For each element A[i,j]:
-            new_A[i,j] = (A[i,j] * pivot - A[i,entering_col] * A[leaving_row,j]) / pivot
+        The pivot row is scaled once, then every other row is eliminated
+        with a single in-place rank-1 update:
+            A -= col ⊗ A[leaving_row],  b -= col * b[leaving_row]
+        where col is the entering column with the pivot entry zeroed.
+        A is updated by BLAS dger; b by NumPy, with entries below EPSILON snapped to 0.
         Args:
             leaving_row: Row index of leaving variable
             entering_col: Column index of entering variable
@@ -111,42 +133,40 @@ class SimplexTable(ITable):
         if abs(pivot_element) < EPSILON:
             raise ValueError(f"Pivot element too close to zero: {pivot_element}")
 
-        # copies
-        A_old = self.A.copy()
-        b_old = self.b.copy()
-
-        # Gauss-Jordan elimination
-        self.A[leaving_row, :] = A_old[leaving_row, :] / pivot_element
-        self.b[leaving_row] = b_old[leaving_row] / pivot_element
-        
-        rows_mask = np.arange(self.A.shape[0]) != leaving_row
-        
-        # new_A[i,j] = (A[i,j] * pivot - A[i,entering_col] * A[leaving_row,j]) / pivot
-        multipliers = A_old[rows_mask, entering_col].reshape(-1, 1)
-        
-        self.A[rows_mask, :] = (
-            A_old[rows_mask, :] * pivot_element - 
-            multipliers * A_old[leaving_row, :]
-        ) / pivot_element
-        
-        self.b[rows_mask] = (
-            b_old[rows_mask] * pivot_element - 
-            A_old[rows_mask, entering_col] * b_old[leaving_row]
-        ) / pivot_element
+        # scale pivot row
+        self.A[leaving_row, :] /= pivot_element
+        self.b[leaving_row] /= pivot_element
+
+        if self.pricing == PricingRule.DEVEX.value:
+            self._update_weights(leaving_row, entering_col, pivot_element)
+
+        # rank-1 elimination (pivot row is left untouched by the zeroed multiplier),
+        # A is done in place by BLAS GER: only the entering column needs a copy,
+        # the scaled pivot row is read straight from the table
+        col = self._col
+        np.copyto(col, self.A[:, entering_col])
+        col[leaving_row] = 0.0
+        self.A = dger(-1.0, col, self.A[leaving_row, :], a=self.A, overwrite_a=1)
+        # NumPy, not BLAS daxpy: the fused multiply-add leaves -1e-17 residues where this gives exact 0
+        self.b -= col * self.b[leaving_row]
+        # any rounding residue left in b would make is_feasible() reject a degenerate basis
+        self.b[np.abs(self.b) < EPSILON] = 0.0
 
         # update basis
         self.basis[leaving_row] = entering_col
+        self._delta = None
+        self.save_iteration(entering_col=entering_col)
 
-        # update table
-        self.table = self._build_table(entering_col=entering_col)
-        self.save_iteration()
-
-    def save_iteration(self) -> None:
-        """Save current table state to iteration history."""
-        self.iterations.append({
-            "headers": self.headers,
-            "data": self.table
-        })
+    def _update_weights(self, leaving_row: int, entering_col: int, pivot_element: float) -> None:
+        """
+        Devex reference weight update (called with the pivot row already scaled):
+            gamma_j = max(gamma_j, (a_rj / a_rq)^2 * gamma_q)
+            gamma_leaving = max(gamma_q / a_rq^2, 1)
+        """
+        gamma_q = self._weights[entering_col]
+        leaving_var = self.basis[leaving_row]
+        np.maximum(self._weights, self.A[leaving_row, :] ** 2 * gamma_q, out=self._weights)
+        self._weights[leaving_var] = max(gamma_q / pivot_element ** 2, 1.0)
 
     def get_solution_vector(self) -> List[float]:
         """
@@ -154,15 +174,12 @@ class SimplexTable(ITable):
         Non-basic variables = 0, basic variables from b.
         """
         n = self.problem.variables_count
-        solution = [0.0] * n
-        
-        for i, var_index in enumerate(self.basis):
-            if var_index < n:
-                solution[var_index] = float(self.b[i])
-        
-        return solution
+        solution = np.zeros(n)
+        in_range = self.basis < n
+        solution[self.basis[in_range]] = self.b[in_range]
+        return solution.tolist()
 
     def get_objective_value(self) -> float:
         """Get current objective function value: cB^T * b"""
-        cB = self.c[self.basis]
-        return float(cB @ self.b)
\ No newline at end of file
+        np.take(self.c, self.basis, out=self._cB)
+        return float(self._cB @ self.b)
\ No newline at end of file
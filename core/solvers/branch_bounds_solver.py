@@ -6,7 +6,7 @@ import heapq
 from utils import ConstraintOperator as CO
 from utils import (
     LPProblem, LPResult, IBFSFinder, ISolver,
-    ConstraintData, SolutionStatus, OptimizationType
+    ConstraintData, SolutionStatus, OptimizationType, OperatorCode
     )
 from .simplex_solver import SimplexSolver
 
@@ -167,9 +167,9 @@ class BranchAndBoundSolver(ISolver):
             if len(non_zero) == 1 and non_zero[0] == var_idx:
                 coef = c.coefficients[var_idx]
                 rhs = c.free_val / coef  # normalize
-                if c.operator == CO.LEQ.value:
+                if c.op_code == OperatorCode.LEQ:
                     ub = min(ub, rhs)
-                elif c.operator == CO.GEQ.value:
+                elif c.op_code == OperatorCode.GEQ:
                     lb = max(lb, rhs)
         return lb, ub
 
@@ -1,16 +1,20 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+import numpy as np
 from ..algorithms import SimplexAlgorithm
-from utils import ConstraintOperator as CO
+from ..bfs import Basic_BFSFinder
 from utils import (
-    LPProblem, LPResult, ConstraintData, 
+    LPProblem, LPResult,
     SolutionStatus, OptimizationType,
     IBFSFinder, ISolver
 )
 
 class SimplexSolver(ISolver):
     """A tamplate for solving linear programming problems."""
-    def __init__(self, bfs_finder: IBFSFinder) -> None:
-        self.bfs_finder = bfs_finder
-        self.algorithm = SimplexAlgorithm()
+    def __init__(self, bfs_finder: Optional[IBFSFinder] = None,
+                 algorithm: Optional[SimplexAlgorithm] = None) -> None:
+        self.bfs_finder = bfs_finder if bfs_finder is not None else Basic_BFSFinder()
+        self.algorithm = algorithm if algorithm is not None else SimplexAlgorithm()
 
     def solve(self, statement: LPProblem) -> LPResult:
         """
@@ -63,42 +67,66 @@ class SimplexSolver(ISolver):
         Returns:
             LPProblem: The linear programming problem in standard form
         """
-        obj_coefs = statement.objective_coefficients.copy()
-
-        # if minimize -> maximize negative function
-        if statement.optimization_type == OptimizationType.MINIMIZE.value:
-            obj_coefs = [-a for a in obj_coefs]
-
-        slack_count = 0
-        slack_needed = sum(1 for c in statement.constraints 
-                           if c.operator in (CO.LEQ.value, CO.GEQ.value))
-        constraints = []
-
-        # make all constraints '='
-        for constraint in statement.constraints:
-            coefs = constraint.coefficients.copy()
-            free_val = constraint.free_val
-            operator = constraint.operator.strip()
-
-            # mult on -1 if free val < 0
-            if free_val < 0:
-                free_val = -free_val
-                coefs = [-a for a in coefs]
-                if operator == CO.GEQ.value: operator = CO.LEQ.value
-                elif operator == CO.LEQ.value: operator = CO.GEQ.value
-
-            # add slack variables
-            slack_vars = [0] * slack_needed
-            if operator in (CO.LEQ.value, CO.GEQ.value):
-                slack_vars[slack_count] = 1 if operator == CO.LEQ.value else -1
-                slack_count += 1
-
-            new_coeffs = coefs + slack_vars
-            constraints.append(ConstraintData(new_coeffs, CO.EQ.value, free_val))
-
-        return LPProblem(
-            optimization_type = OptimizationType.MAXIMIZE.value,
-            objective_coefficients = obj_coefs + [0] * slack_needed,
-            constraints = constraints,
-            variables_count = len(obj_coefs) + slack_needed
-        )
\ No newline at end of file
+        obj_coefs, A_std, b = _standard_form_arrays(statement)
+
+        # fresh containers every call: BFS finders mutate the standard form in place
+        return LPProblem.from_numpy(A_std, b, obj_coefs, OptimizationType.MAXIMIZE.value)
+
+
+_STANDARD_FORM_CACHE_SIZE = 128
+_standard_form_cache: "OrderedDict[Tuple, Tuple[np.ndarray, np.ndarray, np.ndarray]]" = OrderedDict()
+
+
+def _standard_form_arrays(statement: LPProblem) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Standard-form (c, A, b) arrays for a problem, memoized (LRU) on its cache_key()
+    so that re-solving an unchanged problem skips the transformation.
+    Arrays are read-only.
+    """
+    key = statement.cache_key()
+    arrays = _standard_form_cache.get(key)
+    if arrays is not None:
+        _standard_form_cache.move_to_end(key)
+        return arrays
+
+    arrays = _standardize(
+        statement.A_matrix_np, statement.b_vector_np, statement.operator_codes_np,
+        statement.c_vector_np, statement.optimization_type == OptimizationType.MINIMIZE.value
+    )
+    for arr in arrays:
+        arr.flags.writeable = False
+    _standard_form_cache[key] = arrays
+    if len(_standard_form_cache) > _STANDARD_FORM_CACHE_SIZE:
+        _standard_form_cache.popitem(last=False)
+    return arrays
+
+
+def _standardize(A: np.ndarray, b: np.ndarray, ops: np.ndarray,
+                 c: np.ndarray, minimize: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Transform (A, b, ops, c) into max c^T x s.t. A_std x = b, b >= 0.
+    Args:
+        ops: int8 operator codes (-1 for '<=', 0 for '=', +1 for '>=')
+    Returns:
+        (c_std, A_std, b_std) with one slack column per inequality row
+    """
+    # if minimize -> maximize negative function
+    obj_coefs = -c if minimize else c
+
+    # mult rows on -1 if free val < 0 ('<=' and '>=' swap), as one sign vector
+    row_signs = 1.0 - 2.0 * (b < 0)
+    A = A * row_signs[:, None]
+    b = b * row_signs
+
+    # slack sign per row: +1 for '<=', -1 for '>=', 0 for '=' (after the flip)
+    slack_signs = -ops * row_signs
+
+    # add slack variables: one column per inequality, all constraints become '='
+    slack_rows = np.flatnonzero(slack_signs)
+    slack_needed = len(slack_rows)
+    slack = np.zeros((len(b), slack_needed))
+    slack[slack_rows, np.arange(slack_needed)] = slack_signs[slack_rows]
+    A_std = np.hstack([A, slack])
+    obj_coefs = np.concatenate([obj_coefs, np.zeros(slack_needed)])
+
+    return obj_coefs, A_std, b
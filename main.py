@@ -6,10 +6,13 @@ from core import solvers, bfs_finders
 
 from view.app_window import LPSolverApp
 from view import InputSection, ResultSection
+from utils import StyleSheet
 
 
 def main():
     app = QApplication(sys.argv)
+    # parsed once for the whole application instead of per window
+    app.setStyleSheet(StyleSheet.DARK_STYLE)
 
     window = LPSolverApp(
         input_section=InputSection(),
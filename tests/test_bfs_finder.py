@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from core.bfs.basic_finder import Basic_BFSFinder
 from utils import LPProblem, ConstraintData, OptimizationType
 
@@ -26,9 +27,9 @@ class TestBasic_BFSFinder:
         result = finder.find_initial_bfs(problem)
         
         # last 2 slack variables should be in basis
-        assert result.basis_indices == [2, 3]
-        assert result.basic_values == [4, 5]
-        assert result.full_solution == [0.0, 0.0, 4.0, 5.0]
+        np.testing.assert_array_equal(result.basis_indices, [2, 3])
+        np.testing.assert_array_equal(result.basic_values, [4, 5])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 4.0, 5.0])
         assert result.is_feasible() is True
     
     def test_three_constraints(self, finder: Basic_BFSFinder):
@@ -46,9 +47,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [3, 4, 5]
-        assert result.basic_values == [10, 15, 20]
-        assert result.full_solution == [0.0, 0.0, 0.0, 10.0, 15.0, 20.0]
+        np.testing.assert_array_equal(result.basis_indices, [3, 4, 5])
+        np.testing.assert_array_equal(result.basic_values, [10, 15, 20])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 0.0, 10.0, 15.0, 20.0])
         assert result.is_feasible() is True
     
     def test_single_constraint(self, finder: Basic_BFSFinder):
@@ -64,9 +65,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [2]
-        assert result.basic_values == [8]
-        assert result.full_solution == [0.0, 0.0, 8.0]
+        np.testing.assert_array_equal(result.basis_indices, [2])
+        np.testing.assert_array_equal(result.basic_values, [8])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 8.0])
         assert result.is_feasible() is True
     
     def test_four_variables_two_constraints(self, finder: Basic_BFSFinder):
@@ -83,9 +84,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [4, 5]
-        assert result.basic_values == [6, 9]
-        assert result.full_solution == [0.0, 0.0, 0.0, 0.0, 6.0, 9.0]
+        np.testing.assert_array_equal(result.basis_indices, [4, 5])
+        np.testing.assert_array_equal(result.basic_values, [6, 9])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 0.0, 0.0, 6.0, 9.0])
         assert result.is_feasible() is True
     
     def test_zero_free_values(self, finder: Basic_BFSFinder):
@@ -102,9 +103,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [2, 3]
-        assert result.basic_values == [0, 0]
-        assert result.full_solution == [0.0, 0.0, 0.0, 0.0]
+        np.testing.assert_array_equal(result.basis_indices, [2, 3])
+        np.testing.assert_array_equal(result.basic_values, [0, 0])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 0.0, 0.0])
         assert result.is_feasible() is True
     
     def test_large_free_values(self, finder: Basic_BFSFinder):
@@ -121,9 +122,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [2, 3]
-        assert result.basic_values == [1000, 5000]
-        assert result.full_solution == [0.0, 0.0, 1000.0, 5000.0]
+        np.testing.assert_array_equal(result.basis_indices, [2, 3])
+        np.testing.assert_array_equal(result.basic_values, [1000, 5000])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 1000.0, 5000.0])
         assert result.is_feasible() is True
     
     def test_fractional_free_values(self, finder: Basic_BFSFinder):
@@ -140,9 +141,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [2, 3]
-        assert result.basic_values == [3.5, 7.25]
-        assert result.full_solution == [0.0, 0.0, 3.5, 7.25]
+        np.testing.assert_array_equal(result.basis_indices, [2, 3])
+        np.testing.assert_array_equal(result.basic_values, [3.5, 7.25])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 3.5, 7.25])
         assert result.is_feasible() is True
     
     def test_mixed_positive_zero_values(self, finder: Basic_BFSFinder):
@@ -160,9 +161,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [2, 3, 4]
-        assert result.basic_values == [5, 0, 10]
-        assert result.full_solution == [0.0, 0.0, 5.0, 0.0, 10.0]
+        np.testing.assert_array_equal(result.basis_indices, [2, 3, 4])
+        np.testing.assert_array_equal(result.basic_values, [5, 0, 10])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 5.0, 0.0, 10.0])
         assert result.is_feasible() is True
     
     def test_equality_constraints_only(self, finder: Basic_BFSFinder):
@@ -181,9 +182,9 @@ class TestBasic_BFSFinder:
         result = finder.find_initial_bfs(problem)
         
         # n=2, m=2, so basis starts at index 0
-        assert result.basis_indices == [0, 1]
-        assert result.basic_values == [3, 4]
-        assert result.full_solution == [3.0, 4.0]
+        np.testing.assert_array_equal(result.basis_indices, [0, 1])
+        np.testing.assert_array_equal(result.basic_values, [3, 4])
+        np.testing.assert_array_equal(result.full_solution, [3.0, 4.0])
         assert result.is_feasible() is True
     
     def test_one_variable_one_constraint(self, finder: Basic_BFSFinder):
@@ -199,9 +200,9 @@ class TestBasic_BFSFinder:
         
         result = finder.find_initial_bfs(problem)
         
-        assert result.basis_indices == [1]
-        assert result.basic_values == [10]
-        assert result.full_solution == [0.0, 10.0]
+        np.testing.assert_array_equal(result.basis_indices, [1])
+        np.testing.assert_array_equal(result.basic_values, [10])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 10.0])
         assert result.is_feasible() is True
     
     def test_basis_indices_order(self, finder: Basic_BFSFinder):
@@ -221,9 +222,9 @@ class TestBasic_BFSFinder:
         result = finder.find_initial_bfs(problem)
         
         # Last 4 variables
-        assert result.basis_indices == [3, 4, 5, 6]
-        assert result.basic_values == [2, 4, 6, 8]
-        assert result.full_solution == [0.0, 0.0, 0.0, 2.0, 4.0, 6.0, 8.0]
+        np.testing.assert_array_equal(result.basis_indices, [3, 4, 5, 6])
+        np.testing.assert_array_equal(result.basic_values, [2, 4, 6, 8])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 0.0, 2.0, 4.0, 6.0, 8.0])
     
     def test_is_feasible_all_positive(self, finder: Basic_BFSFinder):
         """Test is_feasible returns True for all positive values"""
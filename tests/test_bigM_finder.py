@@ -61,19 +61,19 @@ class TestBigM_BasisIndices:
         """'<=' rows → slack columns n, n+1, … in order."""
         p = make_problem([3, 2], [([1, 1], "<=", 4), ([2, 1], "<=", 5)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [2, 3]
+        np.testing.assert_array_equal(r.basis_indices, [2, 3])
 
     def test_all_eq_basis(self, finder: BigM_BFSFinder):
         """'=' rows → artificial columns n, n+1, … in order."""
         p = make_problem([1, 2], [([1, 0], "=", 3), ([0, 1], "=", 4)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [2, 3]
+        np.testing.assert_array_equal(r.basis_indices, [2, 3])
 
     def test_all_geq_basis(self, finder: BigM_BFSFinder):
         """'>=' rows → artificial columns n, n+1, … in order."""
         p = make_problem([2, 3], [([1, 0], ">=", 2), ([0, 1], ">=", 3)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [2, 3]
+        np.testing.assert_array_equal(r.basis_indices, [2, 3])
 
     def test_mixed_leq_eq_geq_basis(self, finder: BigM_BFSFinder):
         """Mixed: one column per constraint in constraint order."""
@@ -86,7 +86,7 @@ class TestBigM_BasisIndices:
             ],
         )
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [3, 4, 5]
+        np.testing.assert_array_equal(r.basis_indices, [3, 4, 5])
 
     def test_basis_order_mixed(self, finder: BigM_BFSFinder):
         """Order: =, <=, >= → cols n, n+1, n+2 regardless of type."""
@@ -95,19 +95,19 @@ class TestBigM_BasisIndices:
             [([1, 0], "=", 2), ([0, 1], "<=", 4), ([1, 1], ">=", 6)],
         )
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [2, 3, 4]
+        np.testing.assert_array_equal(r.basis_indices, [2, 3, 4])
 
     def test_single_eq_constraint(self, finder: BigM_BFSFinder):
         """One '=' row with 1 original var → basis = [1]."""
         p = make_problem([3], [([1], "=", 10)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [1]
+        np.testing.assert_array_equal(r.basis_indices, [1])
 
     def test_single_leq_constraint(self, finder: BigM_BFSFinder):
         """One '<=' row with 1 original var → basis = [1]."""
         p = make_problem([3], [([1], "<=", 10)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [1]
+        np.testing.assert_array_equal(r.basis_indices, [1])
 
     def test_basis_indices_unique(self, finder: BigM_BFSFinder):
         """All returned basis indices must be distinct."""
@@ -260,7 +260,7 @@ class TestBigM_BFSValues:
         """basic_values must equal the RHS (free_val) of each constraint."""
         p = make_problem([3, 2], [([1, 1], "<=", 4), ([2, 1], "<=", 5)])
         r = finder.find_initial_bfs(p)
-        assert r.basic_values == [4, 5]
+        np.testing.assert_array_equal(r.basic_values, [4, 5])
 
     def test_full_solution_basis_entries(self, finder: BigM_BFSFinder):
         """full_solution[bi] == basic_values[i] for each basis variable."""
@@ -361,9 +361,9 @@ class TestBigM_Mutation:
         r1 = BigM_BFSFinder(BIG_M).find_initial_bfs(p1)
         r2 = BigM_BFSFinder(BIG_M).find_initial_bfs(p2)
 
-        assert r1.basis_indices == r2.basis_indices
-        assert r1.basic_values  == r2.basic_values
-        assert r1.full_solution == r2.full_solution
+        np.testing.assert_array_equal(r1.basis_indices, r2.basis_indices)
+        np.testing.assert_array_equal(r1.basic_values, r2.basic_values)
+        np.testing.assert_array_equal(r1.full_solution, r2.full_solution)
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -375,22 +375,22 @@ class TestBigM_EdgeCases:
     def test_single_variable_single_leq(self, finder: BigM_BFSFinder):
         p = make_problem([5], [([1], "<=", 7)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [1]
-        assert r.basic_values  == [7]
-        assert r.full_solution == [0.0, 7.0]
+        np.testing.assert_array_equal(r.basis_indices, [1])
+        np.testing.assert_array_equal(r.basic_values, [7])
+        np.testing.assert_array_equal(r.full_solution, [0.0, 7.0])
 
     def test_single_variable_single_eq(self, finder: BigM_BFSFinder):
         p = make_problem([3], [([1], "=", 10)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [1]
-        assert r.basic_values  == [10]
+        np.testing.assert_array_equal(r.basis_indices, [1])
+        np.testing.assert_array_equal(r.basic_values, [10])
         assert r.is_feasible()
 
     def test_single_variable_single_geq(self, finder: BigM_BFSFinder):
         p = make_problem([2], [([1], ">=", 4)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [1]
-        assert r.basic_values  == [4]
+        np.testing.assert_array_equal(r.basis_indices, [1])
+        np.testing.assert_array_equal(r.basic_values, [4])
         assert r.is_feasible()
 
     def test_many_constraints_all_leq(self, finder: BigM_BFSFinder):
@@ -398,7 +398,7 @@ class TestBigM_EdgeCases:
         rows = [[float(i == j) for j in range(5)] for i in range(5)]
         p = make_problem([1]*5, [(r, "<=", float(i+1)) for i, r in enumerate(rows)])
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [5, 6, 7, 8, 9]
+        np.testing.assert_array_equal(r.basis_indices, [5, 6, 7, 8, 9])
 
     def test_operator_with_whitespace(self, finder: BigM_BFSFinder):
         """Operators with surrounding whitespace are handled correctly."""
@@ -412,7 +412,7 @@ class TestBigM_EdgeCases:
             variables_count=2,
         )
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [2, 3]
+        np.testing.assert_array_equal(r.basis_indices, [2, 3])
         # row 0 → slack (<=), objective coef = 0
         assert p.objective_coefficients[2] == 0.0
         # row 1 → artificial (=), objective coef = -M
@@ -425,6 +425,6 @@ class TestBigM_EdgeCases:
             [([1, 0], "=", 0), ([0, 1], "=", 0)],
         )
         r = finder.find_initial_bfs(p)
-        assert r.basis_indices == [2, 3]
-        assert r.basic_values  == [0, 0]
+        np.testing.assert_array_equal(r.basis_indices, [2, 3])
+        np.testing.assert_array_equal(r.basic_values, [0, 0])
         assert r.is_feasible()
\ No newline at end of file
@@ -1,17 +1,26 @@
 import pytest
-from unittest.mock import Mock
-from core.solvers.simplex_solver import SimplexSolver, LPProblem, OptimizationType, ConstraintData
+import numpy as np
+from core.solvers.simplex_solver import SimplexSolver
+from utils import LPProblem, OptimizationType, ConstraintData
+
+
+class _NullBFSFinder:
+    """BFS finder stub: _build_standard_form never reaches the finder"""
+    __slots__ = ()
+
+    def find_initial_bfs(self, standard_form):
+        raise AssertionError("BFS finder should not be called")
+
+
+@pytest.fixture(scope="module")
+def solver():
+    """Create solver instance with a stub BFS finder"""
+    return SimplexSolver(_NullBFSFinder())
 
 
 class TestBuildStandardForm:
     """Tests for _build_standard_form method"""
     
-    @pytest.fixture
-    def solver(self):
-        """Create solver instance with mocked dependencies"""
-        bfs_finder = Mock()
-        return SimplexSolver(bfs_finder)
-    
     def test_maximize_with_less_equal_constraints(self, solver: SimplexSolver):
         """Test maximization problem with <= constraints"""
         problem = LPProblem(
@@ -299,4 +308,72 @@ class TestBuildStandardForm:
         
         assert len(result.objective_coefficients) == 3  # 1 original + 2 slack
         assert result.constraints[0].coefficients[1] == 1   #  +1
-        assert result.constraints[1].coefficients[2] == -1  #  -1
\ No newline at end of file
+        assert result.constraints[1].coefficients[2] == -1  #  -1
+
+    def test_repeated_build_returns_independent_copies(self, solver: SimplexSolver):
+        """Test that cached standard forms are not shared between calls"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[1, 2],
+            constraints=[
+                ConstraintData([1, 1], "<=", 3),
+                ConstraintData([2, 1], ">=", 2)
+            ],
+            variables_count=2
+        )
+        
+        first = solver._build_standard_form(problem)
+        first.constraints[0].coefficients[0] = 99
+        first.objective_coefficients.append(7)
+        second = solver._build_standard_form(problem)
+        
+        assert second.constraints[0].coefficients == [1, 1, 1, 0]
+        assert second.objective_coefficients == [1, 2, 0, 0]
+
+    def test_modified_problem_is_rebuilt_after_reset_cache(self, solver: SimplexSolver):
+        """Test that the memoized standard form follows in-place edits after reset_cache"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[1, 2],
+            constraints=[ConstraintData([1, 1], "<=", 3)],
+            variables_count=2
+        )
+        solver._build_standard_form(problem)
+        
+        problem.constraints[0].free_val = -3
+        problem.reset_cache()
+        result = solver._build_standard_form(problem)
+        
+        assert result.constraints[0].coefficients == [-1, -1, -1]
+        assert result.constraints[0].free_val == 3
+
+    def test_in_place_edits_are_picked_up_without_reset_cache(self, solver: SimplexSolver):
+        """Test that editing the lists in place invalidates the cached arrays and memo entry"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[1, 2],
+            constraints=[ConstraintData([1, 1], "<=", 3)],
+            variables_count=2
+        )
+        solver._build_standard_form(problem)
+        
+        problem.constraints[0].coefficients[0] = 5
+        problem.constraints[0].operator = ">="
+        problem.objective_coefficients[1] = 4
+        result = solver._build_standard_form(problem)
+        
+        assert result.constraints[0].coefficients == [5, 1, -1]
+        assert result.objective_coefficients == [1, 4, 0]
+
+    def test_in_place_edits_of_seeded_problem_are_picked_up(self, solver: SimplexSolver):
+        """Test that a problem built from arrays follows in-place edits after its first use"""
+        problem = LPProblem.from_numpy(
+            np.array([[1.0, 1.0]]), np.array([3.0]), np.array([1.0, 2.0]),
+            OptimizationType.MAXIMIZE.value, "<="
+        )
+        solver._build_standard_form(problem)
+        
+        problem.constraints[0].free_val = 7.0
+        result = solver._build_standard_form(problem)
+        
+        assert result.constraints[0].free_val == 7.0
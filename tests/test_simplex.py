@@ -2,7 +2,11 @@ import pytest
 import numpy as np
 from core.solvers.simplex_solver import SimplexSolver
 from core.bfs.basic_finder import Basic_BFSFinder
-from utils import LPProblem, ConstraintData, OptimizationType, SolutionStatus
+from core.simplex_table import SimplexTable
+from utils import (
+    LPProblem, ConstraintData, OptimizationType, SolutionStatus, PricingRule, ConstraintOperator,
+    BFSolution
+)
 
 
 class TestFullSimplexIntegration:
@@ -100,12 +104,9 @@ class TestFullSimplexIntegration:
         assert result.solution is not None
         assert len(result.solution) == 3  # no slack
         
-        # solution is feasible
-        for i, constraint in enumerate(problem.constraints):
-            lhs = sum(constraint.coefficients[j] * result.solution[j] 
-                     for j in range(3))
-            if constraint.operator == "<=":
-                assert lhs <= constraint.free_val + 1e-6
+        # solution is feasible (all constraints are <=)
+        lhs = problem.A_matrix_np @ np.asarray(result.solution)
+        assert np.all(lhs <= problem.b_vector_np + 1e-6)
     
     def test_mixed_constraints(self, solver: SimplexSolver):
         """
@@ -216,6 +217,138 @@ class TestFullSimplexIntegration:
             assert len(iteration["headers"]) > 0
             assert len(iteration["data"]) > 0
     
+    def test_history_disabled_keeps_current_table_only(self, solver: SimplexSolver):
+        """Test that keep_history=False stores only the final table"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[3, 2],
+            constraints=[
+                ConstraintData([1, 1], "<=", 4),
+                ConstraintData([2, 1], "<=", 5)
+            ],
+            variables_count=2
+        )
+        solver.algorithm.keep_history = False
+        
+        result = solver.solve(problem)
+        
+        assert result.status == SolutionStatus.OPTIMAL.value
+        assert abs(result.optimal_value - 9) < 1e-6
+        assert len(result.table.get_full_history()) == 1
+        assert result.table.get_table()["data"][-1][2] == pytest.approx(9)
+    
+    def test_history_keeps_earlier_iterations_when_growing(self, solver: SimplexSolver):
+        """Test that history buffers grow without altering saved iterations"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[3, 2],
+            constraints=[
+                ConstraintData([1, 1], "<=", 4),
+                ConstraintData([2, 1], "<=", 5)
+            ],
+            variables_count=2
+        )
+        table = solver.solve(problem).table
+        history = table.get_full_history()
+        
+        for _ in range(40):
+            table.save_iteration()
+        
+        grown = table.get_full_history()
+        assert len(grown) == len(history) + 40
+        for before, after in zip(history, grown):
+            assert before["data"] == after["data"]
+    
+    def test_large_table_history_past_initial_capacity(self, solver: SimplexSolver):
+        """Test that a large table keeps every iteration readable once its history grows"""
+        m = n = 600
+        pivots = 20
+        problem = LPProblem.from_numpy(
+            np.eye(m, n), np.ones(m), np.ones(n),
+            OptimizationType.MAXIMIZE.value, ConstraintOperator.LEQ.value
+        )
+        standard_form = solver._build_standard_form(problem)
+        table = SimplexTable(standard_form, solver.bfs_finder.find_initial_bfs(standard_form))
+        
+        expected = {0: table.get_iteration_table(0)}
+        for i in range(pivots):
+            table.pivot(i, i)
+            if i + 1 in (1, pivots // 2, pivots):
+                expected[i + 1] = table.get_iteration_table(table.history_length - 1)
+        
+        assert table.history_length == pivots + 1
+        for index, snapshot in expected.items():
+            assert table.get_iteration_table(index) == snapshot
+        with pytest.raises(IndexError):
+            table.get_iteration_table(pivots + 1)
+    
+    def test_iteration_table_matches_full_history(self, solver: SimplexSolver):
+        """Test that single iterations render the same rows as the full history"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[3, 2],
+            constraints=[
+                ConstraintData([1, 1], "<=", 4),
+                ConstraintData([1, 3], "<=", 6)
+            ],
+            variables_count=2
+        )
+        table = solver.solve(problem).table
+        history = table.get_full_history()
+        
+        assert table.history_length == len(history)
+        for i, iteration in enumerate(history):
+            assert table.get_iteration_table(i) == iteration
+        with pytest.raises(IndexError):
+            table.get_iteration_table(len(history))
+    
+    def test_devex_pricing_matches_dantzig(self, solver: SimplexSolver):
+        """Test that Devex pricing reaches the same optimum as Dantzig's rule"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[5, 4, 3],
+            constraints=[
+                ConstraintData([2, 3, 1], "<=", 5),
+                ConstraintData([4, 1, 2], "<=", 11),
+                ConstraintData([3, 4, 2], "<=", 8)
+            ],
+            variables_count=3
+        )
+        dantzig = solver.solve(problem)
+        
+        devex_solver = SimplexSolver(Basic_BFSFinder())
+        devex_solver.algorithm.pricing = PricingRule.DEVEX.value
+        devex = devex_solver.solve(problem)
+        
+        assert devex.status == SolutionStatus.OPTIMAL.value
+        assert abs(devex.optimal_value - 13) < 1e-6
+        assert abs(devex.optimal_value - dantzig.optimal_value) < 1e-6
+        assert np.allclose(devex.solution, dantzig.solution)
+    
+    def test_solve_batch_matches_sequential(self, solver: SimplexSolver):
+        """Test that batch solving returns the same results in input order"""
+        problems = [
+            LPProblem(
+                optimization_type=OptimizationType.MAXIMIZE.value,
+                objective_coefficients=[3, k],
+                constraints=[
+                    ConstraintData([1, 1], "<=", 4),
+                    ConstraintData([2, 1], "<=", 5)
+                ],
+                variables_count=2
+            )
+            for k in (1, 2, 5)
+        ]
+        
+        results = solver.solve_batch(problems, max_workers=2)
+        
+        assert len(results) == len(problems)
+        for problem, result in zip(problems, results):
+            expected = solver.solve(problem)
+            assert result.status == SolutionStatus.OPTIMAL.value
+            assert abs(result.optimal_value - expected.optimal_value) < 1e-6
+            assert np.allclose(result.solution, expected.solution)
+    
     def test_empty_problem(self, solver: SimplexSolver):
         """Test handling of empty problem"""
         problem = LPProblem(
@@ -249,4 +382,74 @@ class TestFullSimplexIntegration:
         # should still find optimal solution even with degeneracy
         assert result.status == SolutionStatus.OPTIMAL.value
         assert result.optimal_value is not None
-        assert result.solution is not None
\ No newline at end of file
+        assert result.solution is not None
+    
+    def test_algorithm_solve_batch_matches_solve_from_bfs(self, solver: SimplexSolver):
+        """Test that stacked batch pivoting agrees with one-by-one solves"""
+        problems = [
+            LPProblem(
+                optimization_type=OptimizationType.MAXIMIZE.value,
+                objective_coefficients=[3, k],
+                constraints=[
+                    ConstraintData([1, 1], "<=", 4),
+                    ConstraintData([2, 1], "<=", 5)
+                ],
+                variables_count=2
+            )
+            for k in (1, 2, 5)
+        ]
+        problems.append(LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[1, 1],
+            constraints=[ConstraintData([1, -1], "<=", 1)],
+            variables_count=2
+        ))
+        problems.append(LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[5, 4, 3],
+            constraints=[
+                ConstraintData([2, 3, 1], "<=", 5),
+                ConstraintData([4, 1, 2], "<=", 11),
+                ConstraintData([3, 4, 2], "<=", 8)
+            ],
+            variables_count=3
+        ))
+        standard_forms = [solver._build_standard_form(p) for p in problems]
+        bfs_list = [solver.bfs_finder.find_initial_bfs(sf) for sf in standard_forms]
+        
+        batch = solver.algorithm.solve_batch(standard_forms, bfs_list)
+        
+        assert len(batch) == len(problems)
+        for sf, bfs, result in zip(standard_forms, bfs_list, batch):
+            expected = solver.algorithm.solve_from_bfs(sf, bfs)
+            assert result.status == expected.status
+            if expected.status == SolutionStatus.OPTIMAL.value:
+                assert result.optimal_value == pytest.approx(expected.optimal_value)
+                assert np.allclose(result.solution, expected.solution)
+        assert batch[3].status == SolutionStatus.UNBOUNDED.value
+    
+    def test_algorithm_solve_batch_ragged_basis(self, solver: SimplexSolver):
+        """Test that a BFS with fewer basic variables than rows does not sink the batch"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MAXIMIZE.value,
+            objective_coefficients=[3, 2],
+            constraints=[
+                ConstraintData([1, 1], "<=", 4),
+                ConstraintData([2, 1], "<=", 5)
+            ],
+            variables_count=2
+        )
+        standard_forms = [solver._build_standard_form(problem) for _ in range(3)]
+        bfs = solver.bfs_finder.find_initial_bfs(standard_forms[0])
+        # same A shape, one basic variable short (as after dropping a redundant row)
+        ragged = BFSolution(basis_indices=[2], basic_values=[4.0])
+        bfs_list = [bfs, ragged, solver.bfs_finder.find_initial_bfs(standard_forms[2])]
+        
+        batch = solver.algorithm.solve_batch(standard_forms, bfs_list)
+        
+        assert len(batch) == 3
+        for sf, b, result in zip(standard_forms, bfs_list, batch):
+            expected = solver.algorithm.solve_from_bfs(sf, b)
+            assert result.status == expected.status
+        assert batch[0].status == SolutionStatus.OPTIMAL.value
+        assert batch[2].optimal_value == pytest.approx(batch[0].optimal_value)
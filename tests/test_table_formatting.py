@@ -0,0 +1,45 @@
+"""
+Unit tests for SimplexTableManager cell formatting.
+
+Cells are formatted without a running QApplication: _format_cells is a
+pure array transform over the rows rendered by ITable.
+"""
+
+import pytest
+
+from core.bfs.bigM_finder import BigM_BFSFinder
+from core.solvers.simplex_solver import SimplexSolver
+from utils import LPProblem, ConstraintData, OptimizationType
+from utils.ui_helper import SimplexTableManager
+
+
+class TestFormatCells:
+    """Formatted table cells keep every digit at the table precision."""
+
+    @pytest.fixture
+    def bigM_iteration(self):
+        """First Big-M iteration of: Minimize 2x + 3y, x + y >= 4, x + 3y >= 6"""
+        problem = LPProblem(
+            optimization_type=OptimizationType.MINIMIZE.value,
+            objective_coefficients=[2, 3],
+            constraints=[
+                ConstraintData([1, 1], ">=", 4),
+                ConstraintData([1, 3], ">=", 6)
+            ],
+            variables_count=2
+        )
+        table = SimplexSolver(BigM_BFSFinder()).solve(problem).table
+        return table.get_iteration_table(0)["data"]
+
+    def test_bigM_values_not_truncated(self, bigM_iteration):
+        """Values like -M and -10M are shown in full, not cut to the raw-value width"""
+        cells = SimplexTableManager._format_cells(bigM_iteration)
+
+        assert cells[0, 1] == "-1000000.0000"
+        assert cells[-1, 2] == "-10000000.0000"
+
+    def test_labels_and_placeholders_kept(self):
+        """Labels stay as they are, None becomes an empty cell"""
+        cells = SimplexTableManager._format_cells([["A1", None, 2.5, "-"]])
+
+        assert cells.tolist() == [["A1", "", "2.5000", "-"]]
@@ -15,7 +15,8 @@ import numpy as np
 from copy import deepcopy
 
 from core.bfs.two_phase_finder import TwoPhase_BFSFinder
-from utils import LPProblem, ConstraintData, BFSolution, OptimizationType
+from core.solvers.simplex_solver import SimplexSolver
+from utils import LPProblem, ConstraintData, BFSolution, OptimizationType, SolutionStatus
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -82,9 +83,9 @@ class TestTwoPhase_PlainSlack:
         problem = make_leq_standard([3.0, 2.0], [[1, 1], [2, 1]], [4, 5])
         result = finder.find_initial_bfs(problem)
 
-        assert result.basis_indices == [2, 3]
-        assert result.basic_values == [4, 5]
-        assert result.full_solution == [0.0, 0.0, 4.0, 5.0]
+        np.testing.assert_array_equal(result.basis_indices, [2, 3])
+        np.testing.assert_array_equal(result.basic_values, [4, 5])
+        np.testing.assert_array_equal(result.full_solution, [0.0, 0.0, 4.0, 5.0])
         assert result.is_feasible()
         # phase1_table should not be built for the slack path
         assert finder.phase1_table is None
@@ -98,8 +99,8 @@ class TestTwoPhase_PlainSlack:
         )
         result = finder.find_initial_bfs(problem)
 
-        assert result.basis_indices == [3, 4, 5]
-        assert result.basic_values == [5, 7, 9]
+        np.testing.assert_array_equal(result.basis_indices, [3, 4, 5])
+        np.testing.assert_array_equal(result.basic_values, [5, 7, 9])
         assert result.is_feasible()
 
     def test_single_leq_constraint(self, finder: TwoPhase_BFSFinder):
@@ -107,8 +108,8 @@ class TestTwoPhase_PlainSlack:
         problem = make_leq_standard([5.0], [[3]], [12])
         result = finder.find_initial_bfs(problem)
 
-        assert result.basis_indices == [1]
-        assert result.basic_values == [12]
+        np.testing.assert_array_equal(result.basis_indices, [1])
+        np.testing.assert_array_equal(result.basic_values, [12])
         assert result.is_feasible()
 
     def test_zero_rhs(self, finder: TwoPhase_BFSFinder):
@@ -116,8 +117,8 @@ class TestTwoPhase_PlainSlack:
         problem = make_leq_standard([1.0, 1.0], [[1, 0], [0, 1]], [0, 0])
         result = finder.find_initial_bfs(problem)
 
-        assert result.basis_indices == [2, 3]
-        assert result.basic_values == [0, 0]
+        np.testing.assert_array_equal(result.basis_indices, [2, 3])
+        np.testing.assert_array_equal(result.basic_values, [0, 0])
         assert result.is_feasible()   # 0 >= 0 → feasible
 
     def test_standard_form_not_mutated_in_plain_path(self, finder: TwoPhase_BFSFinder):
@@ -149,7 +150,7 @@ class TestTwoPhase_Phase1_Feasible:
 
         assert result.is_feasible()
         assert 0 in result.basis_indices        # x1 driven into basis
-        idx = result.basis_indices.index(0)
+        idx = int(np.flatnonzero(result.basis_indices == 0)[0])
         assert abs(result.basic_values[idx] - 5.0) < 1e-8
 
     def test_two_equality_constraints(self, finder: TwoPhase_BFSFinder):
@@ -271,6 +272,26 @@ class TestTwoPhase_Phase1_Feasible:
         assert abs(result.full_solution[0] - 3.14159) < 1e-6
         assert abs(result.full_solution[1] - 2.71828) < 1e-6
 
+    def test_phase1_rhs_without_rounding_residue(self, finder: TwoPhase_BFSFinder):
+        """
+        Phase-1 pivots must leave exact zeros in b: a -1e-17 residue made
+        is_feasible() reject the basis of this feasible (unbounded) LP.
+        """
+        problem = LPProblem(
+            optimization_type=OptimizationType.MINIMIZE.value,
+            objective_coefficients=[4, 0, 0, -3, 5],
+            constraints=[
+                ConstraintData([2, -2, 3, -5, 1], "<=", 3),
+                ConstraintData([4, -4, -2, 5, -5], "<=", -8),
+                ConstraintData([-1, 4, -5, 0, -5], "<=", -8),
+                ConstraintData([-5, 4, -1, 0, -1], "<=", 7),
+            ],
+            variables_count=5,
+        )
+        result = SimplexSolver(finder).solve(problem)
+
+        assert result.status == SolutionStatus.UNBOUNDED.value
+
 
 # ══════════════════════════════════════════════════════════════════════
 # 3. Phase-1 path — infeasible problems
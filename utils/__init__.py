@@ -1,11 +1,22 @@
 from .constants import (
     AppConstants, 
-    InputWidgetConstants, OptimizationType, ConstraintOperator, 
-    ResultConstants, SolutionStatus, StatusColor
+    InputWidgetConstants, OptimizationType, ConstraintOperator, OperatorCode,
+    ResultConstants, SolutionStatus, StatusColor, PricingRule
 )
 from .containers import ConstraintData, LPProblem, LPResult, BFSolution
 from .formatters import ResultFormatter
 from .stylesheet import StyleSheet
-from .ui_helper import UIHelper, ResultUIHelper, SimplexTableManager
 from .validators import InputValidator
-from .interfaces import ITable, IBFSFinder, ISolver
\ No newline at end of file
+from .interfaces import ITable, IBFSFinder, ISolver
+
+
+# Qt-backed helpers are imported on first access (PEP 562),
+# so solver-only imports of utils never load PyQt6
+_UI_HELPERS = ("UIHelper", "ResultUIHelper", "SimplexTableManager")
+
+
+def __getattr__(name: str):
+    if name in _UI_HELPERS:
+        from . import ui_helper
+        return getattr(ui_helper, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 # app
 class AppConstants:
@@ -37,6 +37,16 @@ class ConstraintOperator(Enum):
     GEQ = ">="
     EQ = "="
 
+class OperatorCode(IntEnum):
+    LEQ = -1
+    EQ = 0
+    GEQ = 1
+
+# algorithm
+class PricingRule(Enum):
+    DANTZIG = "dantzig"
+    DEVEX = "devex"
+
 # result
 class ResultConstants:
     SOLUTION_TEXT_HEIGHT = 100
@@ -44,6 +54,9 @@ class ResultConstants:
     TABLE_MAX_HEIGHT = 600
     DECIMAL_PLACES = 6
     TABLE_DECIMAL_PLACES = 4
+    TABLE_FETCH_ROWS = 100  # rows handed to the table view per fetchMore
+    NAVIGATION_DEBOUNCE_MS = 16  # prev/next clicks within this window render once
+    ITERATION_CACHE_SIZE = 32  # formatted iterations kept for back-and-forth navigation
 
 class SolutionStatus(Enum):
     OPTIMAL = 'optimal'
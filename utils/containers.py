@@ -1,15 +1,33 @@
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from utils.constants import ConstraintOperator, OperatorCode
+import numpy as np
 
-@dataclass
+# operator string -> integer code, parsed once per ConstraintData
+OPERATOR_CODES = {
+    ConstraintOperator.LEQ.value: OperatorCode.LEQ,
+    ConstraintOperator.EQ.value: OperatorCode.EQ,
+    ConstraintOperator.GEQ.value: OperatorCode.GEQ
+}
+
+# LPProblem._content_key marker: arrays were seeded to match the content, adopt it on the next check
+_SEEDED = object()
+
+
+@dataclass(slots=True)
 class ConstraintData:
     """Container for single constraint data"""
     coefficients: List[float]
     operator: str
     free_val: float
 
+    @property
+    def op_code(self) -> Optional[OperatorCode]:
+        """Integer code of the operator (None for an unrecognised operator), always current."""
+        return OPERATOR_CODES.get(self.operator.strip())
+
 
-@dataclass
+@dataclass(slots=True)
 class LPProblem:
     """Container for Linear Programming problem data"""
     optimization_type: str = ""
@@ -17,15 +35,125 @@ class LPProblem:
     constraints: List[ConstraintData] = field(default_factory=list)
     integer_indices: Optional[List[int]] = None
     variables_count: int = 0
+    # lazily built numpy views, dropped by reset_cache()
+    _A_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _b_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _c_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _ops_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    # content the cached arrays were last checked against (None = unknown, _SEEDED = trusted)
+    _content_key: Any = field(default=None, init=False, repr=False, compare=False)
     
+    @classmethod
+    def from_numpy(cls, A: np.ndarray, b: np.ndarray, c: np.ndarray, optimization_type: str,
+                   operator: str = ConstraintOperator.EQ.value) -> "LPProblem":
+        """
+        Build a problem from numeric arrays (e.g. a standard form).
+        A and b are kept as the cached A_matrix_np / b_vector_np, so tables built
+        from this problem skip the list -> ndarray conversion.
+        """
+        problem = cls(
+            optimization_type=optimization_type,
+            objective_coefficients=c.tolist(),
+            constraints=[
+                ConstraintData(row, operator, free_val)
+                for row, free_val in zip(A.tolist(), b.tolist())
+            ],
+            variables_count=len(c)
+        )
+        problem.seed_cache(A=A, b=b)
+        return problem
+
     def get_A_matrix(self) -> List[List[float]]:
         return [c.coefficients for c in self.constraints]
 
     def get_b_vector(self) -> List[float]:
         return [c.free_val for c in self.constraints]
 
+    def cache_key(self) -> Tuple:
+        """
+        Hashable structural key of the problem content: optimization type plus the
+        raw bytes of the A, b, c and operator-code arrays.
+        The cached arrays are first checked against the current lists (validate_cache),
+        so in-place edits since the last call are picked up.
+        """
+        self.validate_cache()
+        A = self.A_matrix_np
+        return (
+            self.optimization_type, A.shape, A.tobytes(), self.b_vector_np.tobytes(),
+            self.c_vector_np.tobytes(), self.operator_codes_np.tobytes()
+        )
+
+    @property
+    def A_matrix_np(self) -> np.ndarray:
+        """Constraint matrix as float64 array, built once per problem."""
+        if self._A_np is None:
+            self._A_np = np.array([c.coefficients for c in self.constraints], dtype=np.float64)
+        return self._A_np
+
+    @property
+    def b_vector_np(self) -> np.ndarray:
+        """Right-hand side as float64 array, built once per problem."""
+        if self._b_np is None:
+            self._b_np = np.fromiter(
+                (c.free_val for c in self.constraints),
+                dtype=np.float64, count=len(self.constraints)
+            )
+        return self._b_np
 
-@dataclass
+    @property
+    def c_vector_np(self) -> np.ndarray:
+        """Objective coefficients as float64 array, built once per problem."""
+        if self._c_np is None:
+            self._c_np = np.fromiter(
+                self.objective_coefficients,
+                dtype=np.float64, count=len(self.objective_coefficients)
+            )
+        return self._c_np
+
+    @property
+    def operator_codes_np(self) -> np.ndarray:
+        """Constraint operator codes as int8 array (unrecognised -> EQ), built once per problem."""
+        if self._ops_np is None:
+            self._ops_np = np.fromiter(
+                (c.op_code or OperatorCode.EQ for c in self.constraints),
+                dtype=np.int8, count=len(self.constraints)
+            )
+        return self._ops_np
+
+    def validate_cache(self) -> None:
+        """
+        Drop the cached arrays if the lists were edited in place since the last check.
+        Arrays not checked before are dropped too, unless they were installed by seed_cache.
+        Costs one pass over the lists (no array building when nothing changed).
+        """
+        content = (
+            self.optimization_type,
+            tuple(self.objective_coefficients),
+            tuple((tuple(c.coefficients), c.operator, c.free_val) for c in self.constraints)
+        )
+        if content != self._content_key:
+            if self._content_key is not _SEEDED:
+                self.reset_cache()
+            self._content_key = content
+
+    def reset_cache(self) -> None:
+        """Drop cached arrays after the problem was modified in place."""
+        self._A_np = self._b_np = self._c_np = self._ops_np = None
+        self._content_key = None
+
+    def seed_cache(self, A: Optional[np.ndarray] = None, b: Optional[np.ndarray] = None,
+                   c: Optional[np.ndarray] = None) -> None:
+        """
+        Reset the cache, then install arrays that already match the new content
+        (e.g. a finished Phase 1 tableau) so they are not rebuilt from the lists.
+        Arrays left as None are rebuilt on demand.
+        """
+        self.reset_cache()
+        self._A_np, self._b_np, self._c_np = A, b, c
+        self._content_key = _SEEDED
+
+
+@dataclass(slots=True)
 class LPResult:
     """Container for Linear Programming problem results"""
     status: str
@@ -35,13 +163,26 @@ class LPResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class BFSolution:
     """Basic Feasible Solution (BFS) representation"""
-    basis_indices: List[int]
-    basic_values: List[float]
-    full_solution: Optional[List[float]] = None
-    artificial_indices: Optional[List[int]] = None
+    basis_indices: np.ndarray
+    basic_values: np.ndarray
+    full_solution: Optional[np.ndarray] = None
+    artificial_indices: Optional[np.ndarray] = None
+    _feasible: Optional[bool] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # accept any sequence, store contiguous arrays the tableau can use as-is
+        self.basis_indices = np.asarray(self.basis_indices, dtype=np.intp)
+        self.basic_values = np.asarray(self.basic_values, dtype=np.float64)
+        if self.full_solution is not None:
+            self.full_solution = np.asarray(self.full_solution, dtype=np.float64)
+        if self.artificial_indices is not None:
+            self.artificial_indices = np.asarray(self.artificial_indices, dtype=np.intp)
 
     def is_feasible(self) -> bool:
-        return all(val >= 0 for val in self.basic_values)
\ No newline at end of file
+        # basic_values is fixed once the finder returns, so check it only once
+        if self._feasible is None:
+            self._feasible = bool(np.all(self.basic_values >= 0))
+        return self._feasible
\ No newline at end of file
@@ -1,5 +1,7 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from utils.constants import ResultConstants
+import numpy as np
 
 class ResultFormatter:
     """Formats optimization results for display"""
@@ -16,12 +18,9 @@ class ResultFormatter:
     def format_solution(solution: Optional[List[float]], 
                        decimals: int = ResultConstants.DECIMAL_PLACES) -> str:
         """Format solution vector for display"""
-        if not solution:
+        if solution is None or len(solution) == 0:
             return ""
-        
-        lines = [f"x_{i+1} = {val:.{decimals}f}" 
-                for i, val in enumerate(solution)]
-        return "\n".join(lines)
+        return _format_solution_cached(tuple(solution), decimals)
     
     @staticmethod
     def format_table_value(value: float, 
@@ -29,7 +28,21 @@ class ResultFormatter:
         """Format table cell value"""
         return f"{value:.{decimals}f}"
     
+    @staticmethod
+    def format_table_array(values: np.ndarray,
+                           decimals: int = ResultConstants.TABLE_DECIMAL_PLACES) -> np.ndarray:
+        """Format an array of table cell values in one vectorized call"""
+        return np.char.mod(f"%.{decimals}f", np.asarray(values, dtype=float))
+    
     @staticmethod
     def format_status(status: str) -> str:
         """Format status text"""
-        return status.upper()
\ No newline at end of file
+        return status.upper()
+
+
+@lru_cache(maxsize=32)
+def _format_solution_cached(solution: Tuple[float, ...], decimals: int) -> str:
+    """Solution text for a hashable solution, reused when the same result is shown again"""
+    # numbers formatted in one C-level pass, only the labels are joined in Python
+    values = np.char.mod(f"%.{decimals}f", np.asarray(solution, dtype=float))
+    return "\n".join(f"x_{i} = {value}" for i, value in enumerate(values, 1))
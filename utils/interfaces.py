@@ -1,31 +1,48 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
-from utils.containers import LPProblem, LPProblem, BFSolution, LPResult
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+from utils.containers import LPProblem, BFSolution, LPResult
 import numpy as np
 
+_HISTORY_INITIAL_CAPACITY = 16
+_HISTORY_INITIAL_BYTES = 64 * 2**20  # upfront history budget; larger tables start smaller and grow
+
 
 class ITable(ABC):
     """Interface for LP algorithm tables (Simplex, Dual, etc.)"""
-    def __init__(self, problem: LPProblem, bfs: BFSolution):
+    def __init__(self, problem: LPProblem, bfs: BFSolution, keep_history: bool = True):
         """
         Initialize simplex table based on the given problem and BFS.
         Args:
             problem (LPProblem): Problem in standard form (Ax = b, x >= 0)
             bfs (BFSolution): Basic feasible solution (basis indices, values)
+            keep_history (bool): Snapshot every iteration; if False only the current state is kept
         """
         self.problem = problem
         self.bfs = bfs
+        self.keep_history = keep_history
 
-        self.A = np.array(problem.get_A_matrix(), dtype=float)
-        self.b = np.array(problem.get_b_vector(), dtype=float)
-        self.c = np.array(problem.objective_coefficients, dtype=float)
+        # working copies (the pivot updates them in place) taken straight from the
+        # problem's cached arrays; column-major so entering-column slices and the
+        # BLAS rank-1 pivot are contiguous
+        self.A = np.array(problem.A_matrix_np, dtype=np.float64, order="F")
+        self.b = problem.b_vector_np.copy()
+        self.c = problem.c_vector_np.copy()
         self.basis = np.array(bfs.basis_indices, dtype=int)
 
         self.headers = self._build_headers()
-        self.table = self._build_table()
-        self.iterations: List[Dict[str, Any]] = [
-            {"headers": self.headers, "data": self.table}
-        ]
+
+        # iteration history as stacked arrays, sized for the usual ~2m pivots (within
+        # _HISTORY_INITIAL_BYTES) and grown by doubling past that; entering column -1 = none
+        m, n = self.A.shape
+        capacity = self._initial_history_capacity(m, n) if keep_history else 0
+        self._history_A = np.empty((capacity, m, n))
+        self._history_b = np.empty((capacity, m))
+        self._history_basis = np.empty((capacity, m), dtype=self.basis.dtype)
+        self._history_entering = np.empty(capacity, dtype=np.intp)
+        self._history_len = 0
+        self._live_entering: Optional[int] = None
+        self.save_iteration()
 
     @abstractmethod
     def _build_headers(self) -> List[str]:
@@ -33,10 +50,79 @@ class ITable(ABC):
         pass
 
     @abstractmethod
-    def _build_table(self) -> List[List[Any]]:
-        """Return initial table data."""
+    def _build_table(self, snapshot: Dict[str, Any]) -> List[List[Any]]:
+        """
+        Render table data from a saved state snapshot.
+        Args:
+            snapshot (Dict[str, Any]): {"basis", "A", "b", "entering_col"} as saved by save_iteration
+        """
         pass
 
+    @property
+    def table(self) -> List[List[Any]]:
+        """Current table data, rendered on demand."""
+        return self._build_table(self._snapshot(self._history_len - 1))
+
+    @property
+    def history_length(self) -> int:
+        """Number of saved iterations (O(1), nothing is rendered)."""
+        return self._history_len
+
+    @property
+    def iterations(self) -> List[Dict[str, Any]]:
+        """Rendered iteration history (alias for get_full_history)."""
+        return self.get_full_history()
+
+    def save_iteration(self, entering_col: Optional[int] = None) -> None:
+        """
+        Save the current numeric state to iteration history.
+        Rendering into display rows is deferred until the history is requested.
+        Without keep_history the single snapshot references the live arrays (no copies).
+        Args:
+            entering_col (int | None): Entering column of the pivot that produced this state
+        """
+        if not self.keep_history:
+            self._live_entering = entering_col
+            self._history_len = 1
+            return
+        if self._history_len == len(self._history_A):
+            self._grow_history()
+
+        i = self._history_len
+        self._history_A[i] = self.A
+        self._history_b[i] = self.b
+        self._history_basis[i] = self.basis
+        self._history_entering[i] = -1 if entering_col is None else entering_col
+        self._history_len += 1
+
+    @staticmethod
+    def _initial_history_capacity(m: int, n: int) -> int:
+        """Snapshots to allocate up front: ~2m pivots, at most _HISTORY_INITIAL_BYTES, at least one."""
+        snapshot_bytes = 8 * (m * n + m) + np.dtype(int).itemsize * m
+        by_budget = _HISTORY_INITIAL_BYTES // max(snapshot_bytes, 1)
+        return max(1, min(max(_HISTORY_INITIAL_CAPACITY, 2 * m + 1), by_budget))
+
+    def _grow_history(self) -> None:
+        """Double the capacity of the history buffers."""
+        capacity = max(2 * len(self._history_A), 1)
+        for name in ("_history_A", "_history_b", "_history_basis", "_history_entering"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _snapshot(self, index: int) -> Dict[str, Any]:
+        """Saved state at the given history index, as views into the history buffers."""
+        if not self.keep_history:
+            return {"basis": self.basis, "A": self.A, "b": self.b, "entering_col": self._live_entering}
+        entering_col = int(self._history_entering[index])
+        return {
+            "basis": self._history_basis[index],
+            "A": self._history_A[index],
+            "b": self._history_b[index],
+            "entering_col": None if entering_col < 0 else entering_col
+        }
+
     def get_table(self) -> Dict[str, Any]:
         """
         Return the current simplex table representation.
@@ -51,6 +137,18 @@ class ITable(ABC):
             "data": self.table
         }
 
+    def get_iteration_table(self, index: int) -> Dict[str, Any]:
+        """
+        Return a single iteration of the history, rendering only that snapshot.
+        Args:
+            index (int): 0-based iteration index
+        Returns:
+            Dict[str, Any]: {"headers": [...], "data": [...]}
+        """
+        if not 0 <= index < self._history_len:
+            raise IndexError(f"Iteration index {index} out of range (0..{self._history_len - 1})")
+        return {"headers": self.headers, "data": self._build_table(self._snapshot(index))}
+
     def get_full_history(self) -> List[Dict[str, Any]]:
         """
         Return the full iteration history of simplex tables.
@@ -60,7 +158,10 @@ class ITable(ABC):
                 {"headers": [...], "data": [...]}
             ]
         """
-        return self.iterations
+        return [
+            {"headers": self.headers, "data": self._build_table(self._snapshot(i))}
+            for i in range(self._history_len)
+        ]
 
 
 class IBFSFinder(ABC):
@@ -96,4 +197,18 @@ class ISolver(ABC):
         Returns:
             LPResult: The solution containing optimal value and variables
         """
-        pass
\ No newline at end of file
+        pass
+
+    def solve_batch(self, statements: List[LPProblem], max_workers: Optional[int] = None) -> List[LPResult]:
+        """
+        Solve independent problems in parallel worker processes.
+        Args:
+            statements (List[LPProblem]): Problems to solve
+            max_workers (int | None): Process count (defaults to the CPU count)
+        Returns:
+            List[LPResult]: Results in the same order as statements
+        """
+        if len(statements) <= 1:
+            return [self.solve(statement) for statement in statements]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.solve, statements))
\ No newline at end of file
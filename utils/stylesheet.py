@@ -1,4 +1,10 @@
 class StyleSheet:   
+    # object names matched by the #id selectors below
+    HINT_LABEL = "hintLabel"
+    STATUS_LABEL = "statusLabel"
+    VALUE_LABEL = "valueLabel"
+    ITERATION_LABEL = "iterationLabel"
+
     DARK_STYLE = """
         QMainWindow {
             background-color: #1e1e1e;
@@ -28,6 +34,20 @@ class StyleSheet:
             color: #ffffff;
         }
         
+        QLabel#hintLabel, QLabel#statusLabel {
+            color: #aaaaaa;
+            font-style: italic;
+        }
+        
+        QLabel#valueLabel {
+            color: #4CAF50;
+            font-weight: bold;
+        }
+        
+        QLabel#iterationLabel {
+            font-weight: bold;
+        }
+        
         QLineEdit {
             background-color: #2d2d2d;
             color: #ffffff;
@@ -80,20 +100,20 @@ class StyleSheet:
             color: #888888;
         }
         
-        QTableWidget {
+        QTableView {
             background-color: #2d2d2d;
             gridline-color: #3d3d3d;
             border: 1px solid #3d3d3d;
             border-radius: 4px;
         }
         
-        QTableWidget::item {
+        QTableView::item {
             background-color: #2d2d2d;
             color: #ffffff;
             padding: 5px;
         }
         
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background-color: #0d47a1;
             color: #ffffff;
         }
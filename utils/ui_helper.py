@@ -1,35 +1,57 @@
-from typing import Optional, List
-from PyQt6.QtWidgets import QLabel, QLineEdit, QSpinBox, QLayout, QTextEdit, QTableWidget, QTableWidgetItem
+from collections import OrderedDict
+from functools import lru_cache
+from numbers import Real
+from typing import Optional, List, Tuple
+from PyQt6.QtWidgets import QLabel, QLineEdit, QSpinBox, QTextEdit, QTableView
 from utils.constants import ResultConstants, SolutionStatus, StatusColor
+from utils.formatters import ResultFormatter
+from utils.stylesheet import StyleSheet
 from utils.interfaces import ITable
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QLocale
+from PyQt6.QtGui import QDoubleValidator
+import numpy as np
+
+# element-wise "is this cell a number" test for object arrays
+_is_numeric_cell = np.frompyfunc(lambda value: isinstance(value, Real), 1, 1)
+
+# solution status value -> display color
+_STATUS_COLORS = {status.value: StatusColor[status.name].value for status in SolutionStatus}
+
+# solution status value -> ready-made status label stylesheet
+_STATUS_STYLE_TEMPLATE = "color: {}; font-weight: bold;"
+_STATUS_STYLES = {status: _STATUS_STYLE_TEMPLATE.format(color) for status, color in _STATUS_COLORS.items()}
+_UNKNOWN_STATUS_STYLE = _STATUS_STYLE_TEMPLATE.format(StatusColor.UNKNOWN.value)
+
+
+@lru_cache(maxsize=None)
+def _numeric_validator() -> QDoubleValidator:
+    """One validator shared by every numeric input (C locale, so text always parses with float())"""
+    validator = QDoubleValidator()
+    validator.setLocale(QLocale.c())
+    return validator
 
 
 class UIHelper:
     """Helper methods for UI operations"""
-    @staticmethod
-    def clear_layout(layout: QLayout) -> None:
-        """Clear all widgets from layout"""
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-    
     @staticmethod
     def create_numeric_input(placeholder: str = "0", max_width: int = 70) -> QLineEdit:
         """Factory method for numeric input fields"""
         line_edit = QLineEdit()
         line_edit.setPlaceholderText(placeholder)
         line_edit.setMaximumWidth(max_width)
+        # Qt rejects non-numeric keystrokes before they ever reach the parser
+        line_edit.setValidator(_numeric_validator())
         return line_edit
     
     @staticmethod
     def create_label(text: str, max_width: Optional[int] = None, 
-                    style: Optional[str] = None) -> QLabel:
-        """Factory method for labels"""
+                    style: Optional[str] = None, object_name: Optional[str] = None) -> QLabel:
+        """Factory method for labels (prefer object_name styled by the global sheet over style)"""
         label = QLabel(text)
         if max_width:
             label.setMaximumWidth(max_width)
+        if object_name:
+            label.setObjectName(object_name)
         if style:
             label.setStyleSheet(style)
         return label
@@ -53,14 +75,14 @@ class ResultUIHelper:
     def create_status_label(text: str = "No solution yet") -> QLabel:
         """Create status label with default styling"""
         label = QLabel(text)
-        label.setStyleSheet("color: #aaaaaa; font-style: italic;")
+        label.setObjectName(StyleSheet.STATUS_LABEL)
         return label
     
     @staticmethod
     def create_value_label(text: str = "—") -> QLabel:
         """Create value label with bold styling"""
         label = QLabel(text)
-        label.setStyleSheet("font-weight: bold; color: #4CAF50;")
+        label.setObjectName(StyleSheet.VALUE_LABEL)
         return label
     
     @staticmethod
@@ -68,36 +90,115 @@ class ResultUIHelper:
         """Create solution text widget"""
         text_edit = QTextEdit()
         text_edit.setReadOnly(True)
+        text_edit.setUndoRedoEnabled(False)  # edited in place by the results view, nothing to undo
         text_edit.setMaximumHeight(ResultConstants.SOLUTION_TEXT_HEIGHT)
         text_edit.setMaximumWidth(ResultConstants.SOLUTION_TEXT_WIDTH)
         text_edit.setPlaceholderText("Variable values will appear here...")
         return text_edit
     
     @staticmethod
-    def create_table() -> QTableWidget:
-        """Create simplex table widget"""
-        table = QTableWidget()
+    def create_table() -> QTableView:
+        """Create simplex table view"""
+        table = QTableView()
         table.setMaximumHeight(ResultConstants.TABLE_MAX_HEIGHT)
         return table
     
     @staticmethod
     def get_status_color(status: str) -> str:
         """Get color for status"""
-        try:
-            status_enum = SolutionStatus(status.lower())
-            return StatusColor[status_enum.name].value
-        except (ValueError, KeyError):
-            return StatusColor.UNKNOWN.value
+        return _STATUS_COLORS.get(status.lower(), StatusColor.UNKNOWN.value)
+
+    @staticmethod
+    def get_status_style(status: str) -> str:
+        """Get status label stylesheet for status"""
+        return _STATUS_STYLES.get(status.lower(), _UNKNOWN_STATUS_STYLE)
         
 
+class SimplexTableModel(QAbstractTableModel):
+    """
+    Read-only model over a pre-formatted array of simplex table cells.
+    Rows are exposed to the view in batches of ResultConstants.TABLE_FETCH_ROWS
+    as it scrolls (canFetchMore/fetchMore), so large tableaux cost O(visible).
+    """
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._headers: List[str] = []
+        self._cells = np.empty((0, 0), dtype=str)
+        self._loaded_rows = 0
+
+    def set_table(self, headers: List[str], cells: np.ndarray) -> None:
+        """Replace the displayed table (one model reset, no per-cell items)."""
+        headers = list(headers)
+        if cells.shape == self._cells.shape and headers == self._headers and cells.size:
+            # same layout (e.g. stepping through iterations): keep the view geometry and
+            # repaint only the bounding box of the cells that changed
+            changed = np.argwhere(cells[:self._loaded_rows] != self._cells[:self._loaded_rows])
+            self._cells = cells
+            if changed.size:
+                (top, left), (bottom, right) = changed.min(axis=0), changed.max(axis=0)
+                self.dataChanged.emit(
+                    self.index(int(top), int(left)),
+                    self.index(int(bottom), int(right)),
+                    [Qt.ItemDataRole.DisplayRole]
+                )
+            return
+        self.beginResetModel()
+        self._headers = headers
+        self._cells = cells
+        self._loaded_rows = min(cells.shape[0], ResultConstants.TABLE_FETCH_ROWS)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded_rows
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded_rows < self._cells.shape[0]
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(ResultConstants.TABLE_FETCH_ROWS, self._cells.shape[0] - self._loaded_rows)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        # only called for visible cells
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(self._cells[index.row(), index.column()])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and section < len(self._headers)):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class SimplexTableManager:
-    """Handles displaying LP tables (Simplex, Dual, etc.) in a QTableWidget."""
-    def __init__(self, table_widget: QTableWidget):
+    """Handles displaying LP tables (Simplex, Dual, etc.) in a QTableView."""
+    def __init__(self, table_view: QTableView):
         """
         Args:
-            table_widget (QTableWidget): The table widget instance in the GUI.
+            table_view (QTableView): The table view instance in the GUI.
         """
-        self.table_widget = table_widget
+        self.table_view = table_view
+        self.model = SimplexTableModel(table_view)
+        table_view.setModel(self.model)
+
+        # formatted (headers, cells) per iteration of the table being browsed, LRU-bounded
+        self._iteration_cache: "OrderedDict[int, Tuple[List[str], np.ndarray]]" = OrderedDict()
+        self._cached_table: Optional[ITable] = None
 
     def display_table(self, table: Optional[ITable]) -> None:
         """
@@ -109,6 +210,7 @@ class SimplexTableManager:
             self.clear()
             return
 
+        self._reset_iteration_cache(table)
         table_data = table.get_table()
         self._render_table(table_data)
 
@@ -120,44 +222,60 @@ class SimplexTableManager:
             table (ITable): The simplex table instance (implements iteration history).
             iteration_index (int): Index of the iteration to display (0-based).
         """
-        history = table.get_full_history()
-        if not history:
+        history_len = table.history_length
+        if not history_len:
             self.clear()
             return
 
-        if iteration_index < 0 or iteration_index >= len(history):
+        if iteration_index < 0 or iteration_index >= history_len:
             raise IndexError(
                 f"Iteration index {iteration_index} out of range "
-                f"(0..{len(history)-1})"
+                f"(0..{history_len-1})"
             )
 
-        self._render_table(history[iteration_index])
+        if table is not self._cached_table:
+            self._reset_iteration_cache(table)
+        cached = self._iteration_cache.get(iteration_index)
+        if cached is None:
+            # render only the requested snapshot, not the whole history
+            table_data = table.get_iteration_table(iteration_index)
+            cached = (table_data["headers"], self._format_cells(table_data["data"]))
+            self._iteration_cache[iteration_index] = cached
+            if len(self._iteration_cache) > ResultConstants.ITERATION_CACHE_SIZE:
+                self._iteration_cache.popitem(last=False)
+        else:
+            self._iteration_cache.move_to_end(iteration_index)
+        self.model.set_table(*cached)
+
+    def _reset_iteration_cache(self, table: Optional[ITable]) -> None:
+        """Drop the formatted iterations of the previously browsed table."""
+        self._iteration_cache.clear()
+        self._cached_table = table
 
     def _render_table(self, table_data: dict) -> None:
         """Internal helper to render a table structure."""
         headers: List[str] = table_data.get("headers", [])
         data: List[List[str]] = table_data.get("data", [])
+        self.model.set_table(headers, self._format_cells(data))
 
-        self._setup_dimensions(len(data), len(headers))
-        self.table_widget.setHorizontalHeaderLabels(headers)
-        self._fill_table(data)
-
-    def _setup_dimensions(self, rows: int, cols: int) -> None:
-        """Configure row and column counts before filling the table."""
-        self.table_widget.clear()
-        self.table_widget.setRowCount(rows)
-        self.table_widget.setColumnCount(cols)
+    @staticmethod
+    def _format_cells(data: List[List]) -> np.ndarray:
+        """Format numeric cells with the table precision, keep labels as they are."""
+        cells = np.array(data, dtype=object)
+        # object cells: a fixed-width str array would cut formatted numbers to the width of the raw values
+        text = np.empty(cells.shape, dtype=object)
+        empty = np.equal(cells, None).astype(bool)
+        numeric = _is_numeric_cell(cells).astype(bool)
+        labels = ~(empty | numeric)
 
-    def _fill_table(self, data: List[List]) -> None:
-        """Fill the table widget with simplex data."""
-        for i, row in enumerate(data):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value) if value is not None else "")
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table_widget.setItem(i, j, item)
+        text[empty] = ""
+        if numeric.any():
+            text[numeric] = ResultFormatter.format_table_array(cells[numeric])
+        if labels.any():
+            text[labels] = cells[labels].astype(str)
+        return text
 
     def clear(self) -> None:
-        """Completely clear the table widget."""
-        self.table_widget.clear()
-        self.table_widget.setRowCount(0)
-        self.table_widget.setColumnCount(0)
\ No newline at end of file
+        """Completely clear the table view."""
+        self._reset_iteration_cache(None)
+        self.model.set_table([], np.empty((0, 0), dtype=str))
\ No newline at end of file
@@ -1,5 +1,6 @@
 
 from typing import List
+import numpy as np
 
 class InputValidator:
     """Validates user input data"""
@@ -14,11 +15,17 @@ class InputValidator:
     @staticmethod
     def validate_coefficients(inputs: List, prefix: str = "a") -> List[float]:
         """Validate list of coefficient inputs"""
-        coefficients = []
-        for i, line_edit in enumerate(inputs):
-            value = InputValidator.validate_coefficient(
-                line_edit.text(), 
-                f"{prefix}{i+1}"
-            )
-            coefficients.append(value)
-        return coefficients
\ No newline at end of file
+        return InputValidator.parse_coefficients(inputs, prefix).tolist()
+
+    @staticmethod
+    def parse_coefficients(inputs: List, prefix: str = "a") -> np.ndarray:
+        """Validate coefficient inputs into a float64 array"""
+        texts = [line_edit.text().strip() or "0" for line_edit in inputs]
+        try:
+            # one C-level parse for the whole row
+            return np.array(texts, dtype=np.float64)
+        except ValueError:
+            # slow path only to name the offending field
+            for i, text in enumerate(texts):
+                InputValidator.validate_coefficient(text, f"{prefix}{i+1}")
+            raise
\ No newline at end of file
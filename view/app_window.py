@@ -2,18 +2,22 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QTabWidget, QMessageBox, QComboBox
 )
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
-from typing import Dict
+from typing import Dict, Tuple
 from . import InputSection, ResultSection
 from core.solvers.simplex_solver import SimplexSolver
 from utils import ( 
-    StyleSheet, AppConstants,
+    AppConstants,
     IBFSFinder, ISolver
 )
 
 
 class LPSolverApp(QMainWindow):
     """Main application window for LP solver"""
+    # (point size, bold) -> shared QFont
+    _FONT_CACHE: Dict[Tuple[int, bool], QFont] = {}
+
     def __init__(self, input_section: InputSection, results_section: ResultSection,
                  bfs_finders: Dict[str, IBFSFinder], solvers: Dict[str, ISolver]) -> None:
         """
@@ -39,7 +43,6 @@ class LPSolverApp(QMainWindow):
         """Set ups window settings"""
         self.setWindowTitle(AppConstants.WINDOW_TITLE)
         self.setMinimumSize(AppConstants.WINDOW_SIZE[0], AppConstants.WINDOW_SIZE[1])
-        self.setStyleSheet(StyleSheet.DARK_STYLE)
 
     def init_ui(self) -> None:
         """Initialize the user interface layout and components"""
@@ -64,10 +67,10 @@ class LPSolverApp(QMainWindow):
         self.tabs.addTab(input_tab, "Input")
         
         # results tab
-        results_tab = QWidget()
-        results_layout = QVBoxLayout(results_tab)
+        self.results_tab = QWidget()
+        results_layout = QVBoxLayout(self.results_tab)
         results_layout.addWidget(self.results_section)
-        self.tabs.addTab(results_tab, "Results")
+        self.tabs.addTab(self.results_tab, "Results")
         
         main_layout.addWidget(self.tabs)
 
@@ -91,10 +94,7 @@ class LPSolverApp(QMainWindow):
     def _create_title(self) -> QLabel:
         """Create and configure the title label"""
         title = QLabel("Linear Programming Solver")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._font(16))
         return title
     
     def _create_buttons_layout(self) -> QHBoxLayout:
@@ -110,23 +110,39 @@ class LPSolverApp(QMainWindow):
         buttons_layout.addStretch()
         return buttons_layout
     
-    @staticmethod
-    def _create_button(text: str, height: int, font_size: int) -> QPushButton:
+    @classmethod
+    def _create_button(cls, text: str, height: int, font_size: int) -> QPushButton:
         """Create a styled button"""
         button = QPushButton(text)
         button.setMinimumHeight(height)
-        
-        font = QFont()
-        font.setPointSize(font_size)
-        font.setBold(True)
-        button.setFont(font)
-        
+        button.setFont(cls._font(font_size))
         return button
     
+    @classmethod
+    def _font(cls, size: int, bold: bool = True) -> QFont:
+        """Return the shared QFont for the given size and weight"""
+        key = (size, bold)
+        try:
+            return cls._FONT_CACHE[key]
+        except KeyError:
+            font = QFont()
+            font.setPointSize(size)
+            font.setBold(bold)
+            cls._FONT_CACHE[key] = font
+            return font
+    
     def _connect_signals(self) -> None:
         """Connect button signals to their slots"""
-        self.clear_btn.clicked.connect(self.on_clear)
-        self.solve_btn.clicked.connect(self.on_solve)
+        # all emitters live in the GUI thread: call the slots directly, no auto-connection lookup
+        direct = Qt.ConnectionType.DirectConnection
+        self.clear_btn.clicked.connect(self.on_clear, direct)
+        self.solve_btn.clicked.connect(self.on_solve, direct)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _on_tab_changed(self, index: int) -> None:
+        """Build the result widgets the first time the Results tab is opened"""
+        if self.tabs.widget(index) is self.results_tab:
+            self.results_section.ensure_built()
     
     def on_clear(self) -> None:
         """Handle clear button click - reset all forms"""
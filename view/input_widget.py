@@ -1,4 +1,6 @@
 from typing import List, Optional, Tuple
+import numpy as np
+from PyQt6.QtCore import Qt, QSignalBlocker
 from PyQt6.QtWidgets import (
     QGroupBox, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, 
     QComboBox, QPushButton, QScrollArea, QWidget, QCheckBox
@@ -6,9 +8,13 @@ from PyQt6.QtWidgets import (
 from utils import (
     UIHelper, InputWidgetConstants, InputValidator,
     ConstraintData, LPProblem,
-    ConstraintOperator, OptimizationType
+    ConstraintOperator, OptimizationType, StyleSheet
 )
 
+# combo box items, materialized once
+_OPT_TYPE_ITEMS = [opt.value for opt in OptimizationType]
+_CONSTRAINT_OP_ITEMS = [op.value for op in ConstraintOperator]
+
 
 class InputSection(QGroupBox):
     """Widget for problem input and configuration"""
@@ -17,6 +23,14 @@ class InputSection(QGroupBox):
         self.constraint_rows: List[ConstraintRow] = []
         self.objective_inputs: List[QLineEdit] = []
         self.integer_checkboxes: List[QCheckBox] = []
+
+        # widget pools: grown on demand, the tail past the current size is hidden
+        self._objective_pool: List[Tuple[QLabel, QLineEdit]] = []
+        self._integer_pool: List[QCheckBox] = []
+        self._row_pool: List[ConstraintRow] = []
+
+        # parsed objective coefficients, dropped whenever an objective input changes
+        self._objective_cache: Optional[List[float]] = None
         self._init_widgets()
         self._init_ui()
     
@@ -44,7 +58,7 @@ class InputSection(QGroupBox):
         config_layout = self._create_config_layout()
         layout.addLayout(config_layout)
         
-        self.generate_btn.clicked.connect(self.update)
+        self.generate_btn.clicked.connect(self.update, Qt.ConnectionType.DirectConnection)
         layout.addWidget(self.generate_btn)
         
         layout.addSpacing(15)
@@ -56,6 +70,7 @@ class InputSection(QGroupBox):
         objective_container.setMaximumWidth(InputWidgetConstants.MAX_OBJECTIVE_WIDTH)
         self.objective_layout = QHBoxLayout(objective_container)
         self.objective_layout.setContentsMargins(0, 0, 0, 0)
+        self.objective_layout.addStretch()
         layout.addWidget(objective_container)
         
         layout.addSpacing(15)
@@ -68,16 +83,17 @@ class InputSection(QGroupBox):
         # integer constraints
         layout.addWidget(UIHelper.create_label(
             "Integer Constraints (select variables that must be integers):",
-            style="color: #aaaaaa; font-style: italic;"
+            object_name=StyleSheet.HINT_LABEL
         ))
         integer_container = QWidget()
         self.integer_vars_layout = QHBoxLayout(integer_container)
+        self.integer_vars_layout.addStretch()
         layout.addWidget(integer_container)
     
     def _create_optimization_combo(self) -> QComboBox:
         """Create optimization type combo box"""
         combo = QComboBox()
-        combo.addItems([opt.value for opt in OptimizationType])
+        combo.addItems(_OPT_TYPE_ITEMS)
         combo.setMaximumWidth(InputWidgetConstants.COMBO_WIDTH)
         return combo
     
@@ -105,7 +121,7 @@ class InputSection(QGroupBox):
         """Create objective function label"""
         return UIHelper.create_label(
             "Objective Function: f = a1*x1 + a2*x2 + ... (all variables >= 0)",
-            style="color: #aaaaaa; font-style: italic;"
+            object_name=StyleSheet.HINT_LABEL
         )
     
     @staticmethod
@@ -113,7 +129,7 @@ class InputSection(QGroupBox):
         """Create constraints label"""
         return UIHelper.create_label(
             "Constraints: aij*xij {<=,>=,=} bi",
-            style="color: #aaaaaa; font-style: italic;"
+            object_name=StyleSheet.HINT_LABEL
         )
     
     def _create_constraints_scroll(self) -> QScrollArea:
@@ -125,6 +141,7 @@ class InputSection(QGroupBox):
         self.constraints_layout = QVBoxLayout(self.constraints_container)
         self.constraints_layout.setSpacing(10)
         self.constraints_layout.setContentsMargins(5, 5, 5, 5)
+        self.constraints_layout.addStretch()
         
         scroll.setWidget(self.constraints_container)
         return scroll
@@ -133,34 +150,52 @@ class InputSection(QGroupBox):
         """Update input form based on selected parameters"""
         var_count = self.var_count.value()
         constraint_count = self.constraint_count.value()
-        
-        self._update_objective_inputs(var_count)
-        self._update_integer_selection(var_count)
-        self._update_constraint_rows(var_count, constraint_count)
+
+        # suspend repaints so the whole resize lands in a single update
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_objective_inputs(var_count)
+            self._update_integer_selection(var_count)
+            self._update_constraint_rows(var_count, constraint_count)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _update_integer_selection(self, var_count: int) -> None:
-        """Create checkboxes for each variable to mark as integer"""
-        UIHelper.clear_layout(self.integer_vars_layout)
-        self.integer_checkboxes.clear()
-        
-        for i in range(var_count):
+        """Show one checkbox per variable to mark it as integer"""
+        layout = self.integer_vars_layout
+        for i in range(len(self._integer_pool), var_count):
             cb = QCheckBox(f"x{i+1}")
-            self.integer_checkboxes.append(cb)
-            self.integer_vars_layout.addWidget(cb)
-        self.integer_vars_layout.addStretch()
+            self._integer_pool.append(cb)
+            layout.insertWidget(layout.count() - 1, cb)  # before the stretch
+
+        for i, cb in enumerate(self._integer_pool):
+            visible = i < var_count
+            if visible and cb.isHidden():
+                cb.setChecked(False)
+            cb.setVisible(visible)
+        self.integer_checkboxes = self._integer_pool[:var_count]
     
     def _update_objective_inputs(self, var_count: int) -> None:
         """Update objective function coefficient inputs"""
-        UIHelper.clear_layout(self.objective_layout)
-        self.objective_inputs.clear()
-        
-        for i in range(var_count):
+        layout = self.objective_layout
+        for i in range(len(self._objective_pool), var_count):
             label, line_edit = self._create_coefficient_input(i + 1)
-            self.objective_inputs.append(line_edit)
-            self.objective_layout.addWidget(label)
-            self.objective_layout.addWidget(line_edit)
-        
-        self.objective_layout.addStretch()
+            line_edit.textChanged.connect(self._invalidate_objective)
+            self._objective_pool.append((label, line_edit))
+            layout.insertWidget(layout.count() - 1, label)  # before the stretch
+            layout.insertWidget(layout.count() - 1, line_edit)
+
+        for i, (label, line_edit) in enumerate(self._objective_pool):
+            visible = i < var_count
+            if visible and line_edit.isHidden():
+                line_edit.clear()
+            label.setVisible(visible)
+            line_edit.setVisible(visible)
+        self.objective_inputs = [line_edit for _, line_edit in self._objective_pool[:var_count]]
+        self._objective_cache = None
+
+    def _invalidate_objective(self, *_) -> None:
+        self._objective_cache = None
     
     def _create_coefficient_input(self, index: int) -> Tuple[QLabel, QLineEdit]:
         """Factory method for creating coefficient inputs"""
@@ -169,29 +204,24 @@ class InputSection(QGroupBox):
         return label, line_edit
     
     def _update_constraint_rows(self, var_count: int, constraint_count: int) -> None:
-        """Update constraint rows"""
-        self._cleanup_constraint_rows()
+        """Update constraint rows, reusing pooled rows and hiding the unused tail"""
+        for row in self._row_pool[:constraint_count]:
+            row.set_var_count(var_count)
         self._create_new_constraint_rows(var_count, constraint_count)
-    
-    def _cleanup_constraint_rows(self) -> None:
-        """Clean up existing constraint rows"""
-        for row in self.constraint_rows:
-            row.cleanup()
-        self.constraint_rows.clear()
-        UIHelper.clear_layout(self.constraints_layout)
+
+        for i, row in enumerate(self._row_pool):
+            visible = i < constraint_count
+            if visible and row.isHidden():
+                row.clear()
+            row.setVisible(visible)
+        self.constraint_rows = self._row_pool[:constraint_count]
     
     def _create_new_constraint_rows(self, var_count: int, constraint_count: int) -> None:
-        """Create new constraint rows"""
-        for i in range(constraint_count):
+        """Create the rows the pool is still missing"""
+        for i in range(len(self._row_pool), constraint_count):
             row = ConstraintRow(i + 1, var_count)
-            self.constraint_rows.append(row)
-            
-            row_widget = QWidget()
-            row_widget.setLayout(row)
-            row_widget.setMaximumWidth(InputWidgetConstants.MAX_CONSTRAINT_ROW_WIDTH)
-            self.constraints_layout.addWidget(row_widget)
-        
-        self.constraints_layout.addStretch()
+            self._row_pool.append(row)
+            self.constraints_layout.insertWidget(self.constraints_layout.count() - 1, row)
     
     def get_data(self) -> Tuple[LPProblem, bool, str]:
         """
@@ -205,19 +235,29 @@ class InputSection(QGroupBox):
             str: Error message if validation failed, empty string otherwise.
         """
         try:
-            objective_coeffs = InputValidator.validate_coefficients(
-                self.objective_inputs
-            )
+            if self._objective_cache is None:
+                self._objective_cache = InputValidator.validate_coefficients(
+                    self.objective_inputs
+                )
+            objective_coeffs = list(self._objective_cache)
             int_indices = [i for i, cb in enumerate(self.integer_checkboxes) if cb.isChecked()]
             constraints_data = self._parse_constraints()
             
-            return LPProblem(
+            problem = LPProblem(
                 optimization_type=self.optimization_type.currentText(),
                 objective_coefficients=objective_coeffs,
                 constraints=constraints_data,
                 integer_indices=int_indices,
                 variables_count=len(objective_coeffs)
-            ), True, ""
+            )
+            if self.constraint_rows:
+                # the rows already hold float arrays: hand them to the solver as A and b directly
+                problem.seed_cache(
+                    A=np.vstack([row.values() for row in self.constraint_rows]),
+                    b=np.fromiter((c.free_val for c in constraints_data), dtype=np.float64,
+                                  count=len(constraints_data))
+                )
+            return problem, True, ""
         except ValueError as e:
             return None, False, str(e)
     
@@ -234,14 +274,17 @@ class InputSection(QGroupBox):
     
     def clear(self) -> None:
         """Clear all input fields"""
+        # no textChanged per field: the parse cache is dropped once afterwards
         for line_edit in self.objective_inputs:
-            line_edit.clear()
+            with QSignalBlocker(line_edit):
+                line_edit.clear()
+        self._objective_cache = None
         
         for row in self.constraint_rows:
             row.clear()
 
 
-class ConstraintRow(QHBoxLayout):
+class ConstraintRow(QWidget):
     """Single constraint row widget"""
     def __init__(self, constraint_num: int, var_count: int) -> None:
         super().__init__()
@@ -249,11 +292,16 @@ class ConstraintRow(QHBoxLayout):
         self.var_count = var_count
         
         self.coefficient_inputs: List[QLineEdit] = []
+        self._coefficient_pool: List[Tuple[QLineEdit, QLabel]] = []
         self.operator_combo: Optional[QComboBox] = None
         self.free_vars_input: Optional[QLineEdit] = None
+        # parsed (coefficients, free value), dropped whenever one of the inputs changes
+        self._cached_values: Optional[Tuple[np.ndarray, float]] = None
         
-        self.setContentsMargins(0, 0, 0, 0)
-        self.setSpacing(5)
+        self.setMaximumWidth(InputWidgetConstants.MAX_CONSTRAINT_ROW_WIDTH)
+        self._layout = QHBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(5)
         
         self._build_row()
     
@@ -263,7 +311,7 @@ class ConstraintRow(QHBoxLayout):
         self._add_coefficient_inputs()
         self._add_operator_combo()
         self._add_free_value_input()
-        self.addStretch()
+        self._layout.addStretch()
     
     def _add_constraint_label(self) -> None:
         """Add constraint number label"""
@@ -271,30 +319,54 @@ class ConstraintRow(QHBoxLayout):
             f"{self.constraint_num}:", 
             InputWidgetConstants.CONSTRAINT_NUM_WIDTH
         )
-        self.addWidget(label)
+        self._layout.addWidget(label)
     
     def _add_coefficient_inputs(self) -> None:
         """Add coefficient input fields"""
         for i in range(self.var_count):
-            coef_input = UIHelper.create_numeric_input(
-                "0", 
-                InputWidgetConstants.COEFFICIENT_INPUT_WIDTH
-            )
-            self.coefficient_inputs.append(coef_input)
-            self.addWidget(coef_input)
-            
-            var_label = UIHelper.create_label(
-                f"x{i+1}", 
-                InputWidgetConstants.VAR_LABEL_WIDTH
-            )
-            self.addWidget(var_label)
+            self._insert_coefficient_input(i)
+
+    def _insert_coefficient_input(self, i: int) -> None:
+        """Create the i-th coefficient input with its variable label, before the operator"""
+        coef_input = UIHelper.create_numeric_input(
+            "0", 
+            InputWidgetConstants.COEFFICIENT_INPUT_WIDTH
+        )
+        var_label = UIHelper.create_label(
+            f"x{i+1}", 
+            InputWidgetConstants.VAR_LABEL_WIDTH
+        )
+        position = 1 + 2 * len(self._coefficient_pool)  # after the number label
+        self._layout.insertWidget(position, coef_input)
+        self._layout.insertWidget(position + 1, var_label)
+        coef_input.textChanged.connect(self._invalidate)
+        self._coefficient_pool.append((coef_input, var_label))
+        self.coefficient_inputs.append(coef_input)
+
+    def set_var_count(self, var_count: int) -> None:
+        """Show var_count coefficient inputs, creating missing ones and hiding the rest"""
+        for i in range(len(self._coefficient_pool), var_count):
+            self._insert_coefficient_input(i)
+
+        for i, (coef_input, var_label) in enumerate(self._coefficient_pool):
+            visible = i < var_count
+            if visible and coef_input.isHidden():
+                coef_input.clear()
+            coef_input.setVisible(visible)
+            var_label.setVisible(visible)
+        self.var_count = var_count
+        self.coefficient_inputs = [coef_input for coef_input, _ in self._coefficient_pool[:var_count]]
+        self._cached_values = None
+
+    def _invalidate(self, *_) -> None:
+        self._cached_values = None
     
     def _add_operator_combo(self) -> None:
         """Add operator combo box"""
         self.operator_combo = QComboBox()
-        self.operator_combo.addItems([op.value for op in ConstraintOperator])
+        self.operator_combo.addItems(_CONSTRAINT_OP_ITEMS)
         self.operator_combo.setMaximumWidth(InputWidgetConstants.OPERATOR_WIDTH)
-        self.addWidget(self.operator_combo)
+        self._layout.addWidget(self.operator_combo)
     
     def _add_free_value_input(self) -> None:
         """Add free value input field"""
@@ -302,30 +374,40 @@ class ConstraintRow(QHBoxLayout):
             "0", 
             InputWidgetConstants.FREE_VAL_WIDTH
         )
-        self.addWidget(self.free_vars_input)
+        self.free_vars_input.textChanged.connect(self._invalidate)
+        self._layout.addWidget(self.free_vars_input)
     
+    def _parse(self) -> Tuple[np.ndarray, float]:
+        """Parse the inputs once, re-parsing only after they changed"""
+        if self._cached_values is None:
+            coefficients = InputValidator.parse_coefficients(
+                self.coefficient_inputs,
+                prefix="x_"
+            )
+            coefficients.flags.writeable = False
+            free_val = InputValidator.validate_coefficient(
+                self.free_vars_input.text(),
+                "free value"
+            )
+            self._cached_values = (coefficients, free_val)
+        return self._cached_values
+
+    def values(self) -> np.ndarray:
+        """Coefficients of this row as a read-only float64 array"""
+        return self._parse()[0]
+
     def get_data(self) -> ConstraintData:
         """Extract constraint data"""
-        coefficients = InputValidator.validate_coefficients(
-            self.coefficient_inputs,
-            prefix="x_"
-        )
-        free_val = InputValidator.validate_coefficient(
-            self.free_vars_input.text(),
-            "free value"
-        )
+        coefficients, free_val = self._parse()
         return ConstraintData(
-            coefficients=coefficients,
+            coefficients=coefficients.tolist(),
             operator=self.operator_combo.currentText(),
             free_val=free_val
         )
     
     def clear(self) -> None:
         """Clear all input fields in this row"""
-        for line_edit in self.coefficient_inputs:
-            line_edit.clear()
-        self.free_vars_input.clear()
-    
-    def cleanup(self) -> None:
-        """Clean up resources"""
-        UIHelper.clear_layout(self)
\ No newline at end of file
+        for line_edit in (*self.coefficient_inputs, self.free_vars_input):
+            with QSignalBlocker(line_edit):
+                line_edit.clear()
+        self._cached_values = None
\ No newline at end of file
@@ -1,11 +1,14 @@
+from os.path import commonprefix
 from typing import List, Optional
 from PyQt6.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 )
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QTextCursor
 from utils import ITable
 from utils import (
     ResultUIHelper, SimplexTableManager,
-    LPResult, SolutionStatus, ResultFormatter
+    LPResult, SolutionStatus, ResultFormatter, StyleSheet, ResultConstants
 )
 
 
@@ -15,12 +18,27 @@ class ResultSection(QGroupBox):
         super().__init__("Results")
         self.current_iteration = 0
         self.table_ref: Optional[ITable] = None
+        self._shown_solution: Optional[List[float]] = None  # solution currently in solution_text
+        self._shown_text = ""  # plain text currently in solution_text
+        self._shown_result: Optional[LPResult] = None  # result currently displayed
+        self._built = False
+
+        # only the status line up front; the rest is built on first use
+        self.status_label = ResultUIHelper.create_status_label()
+        self._layout = QVBoxLayout(self)
+        self._layout.setSpacing(10)
+        self._layout.addWidget(self.status_label)
+
+    def ensure_built(self) -> None:
+        """Build the value, solution, table and navigation widgets once, on first use"""
+        if self._built:
+            return
+        self._built = True
         self._init_widgets()
         self._init_ui()
     
     def _init_widgets(self) -> None:
         """Initialize widgets"""
-        self.status_label = ResultUIHelper.create_status_label()
         self.optimal_value_label = ResultUIHelper.create_value_label()
         self.solution_text = ResultUIHelper.create_solution_text()
         self.simplex_table = ResultUIHelper.create_table()
@@ -30,19 +48,22 @@ class ResultSection(QGroupBox):
         self.prev_btn = QPushButton("<<")
         self.next_btn = QPushButton(">>")
         self.iteration_label = QLabel("Iteration: — / —")
-        self.iteration_label.setStyleSheet("font-weight: bold;")
+        self.iteration_label.setObjectName(StyleSheet.ITERATION_LABEL)
 
         self.prev_btn.clicked.connect(self._show_prev_iteration)
         self.next_btn.clicked.connect(self._show_next_iteration)
         self.prev_btn.setEnabled(False)
         self.next_btn.setEnabled(False)
+
+        # rapid prev/next clicks only move current_iteration; the table is rendered once they settle
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(ResultConstants.NAVIGATION_DEBOUNCE_MS)
+        self._nav_timer.timeout.connect(self._flush_iteration)
     
     def _init_ui(self) -> None:
         """Initialize the results section UI"""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(10)
-        
-        layout.addWidget(self.status_label)
+        layout = self._layout
         layout.addLayout(self._create_optimal_value_layout())
         layout.addWidget(QLabel("Solution:"))
         layout.addWidget(self.solution_text)
@@ -73,10 +94,14 @@ class ResultSection(QGroupBox):
     # main interface
     def display_results(self, result: LPResult) -> None:
         """Display optimization results"""
+        if result is self._shown_result:
+            return  # re-emitted result: everything is already on screen
+        self.ensure_built()
         if result.error_message:
             self.display_error(result.error_message)
             return
         
+        self._shown_result = result
         self._update_status(result.status)
         self._update_optimal_value(result.optimal_value)
         self._update_solution(result.solution)
@@ -84,9 +109,13 @@ class ResultSection(QGroupBox):
     
     def display_error(self, error_message: str) -> None:
         """Display an error message"""
+        self.ensure_built()
         self._update_status(SolutionStatus.ERROR.value)
         self.optimal_value_label.setText("-")
-        self.solution_text.setPlainText(error_message)
+        self._set_solution_text(error_message)
+        self._shown_solution = None
+        self._shown_result = None
+        self._nav_timer.stop()
         self.table_manager.clear()
         self._toggle_iteration_controls(False)
         self.iteration_label.setText("Iteration: — / —")
@@ -94,30 +123,52 @@ class ResultSection(QGroupBox):
     def clear(self) -> None:
         """Clear all result displays"""
         self.status_label.setText("No solution yet")
-        self.status_label.setStyleSheet("color: #aaaaaa; font-style: italic;")
+        self.status_label.setStyleSheet("")  # back to the #statusLabel rule
+        self._shown_result = None
+        if not self._built:
+            return
         self.optimal_value_label.setText("-")
-        self.solution_text.clear()
+        self._set_solution_text("")
+        self._shown_solution = None
+        self._nav_timer.stop()
         self.table_manager.clear()
         self._toggle_iteration_controls(False)
         self.iteration_label.setText("Iteration: — / —")
     
     # updates
     def _update_status(self, status: str) -> None:
-        color = ResultUIHelper.get_status_color(status)
+        style = ResultUIHelper.get_status_style(status)
         formatted_status = ResultFormatter.format_status(status)
         self.status_label.setText(f"Status: {formatted_status}")
-        self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        if self.status_label.styleSheet() != style:  # same status again: no CSS re-parse
+            self.status_label.setStyleSheet(style)
     
     def _update_optimal_value(self, value: Optional[float]) -> None:
         formatted_value = ResultFormatter.format_optimal_value(value)
         self.optimal_value_label.setText(formatted_value)
     
     def _update_solution(self, solution: Optional[List[float]]) -> None:
+        if solution and solution == self._shown_solution:
+            return  # same text already shown, skip the document relayout
+        self._shown_solution = list(solution) if solution else None
         if solution:
-            formatted_solution = ResultFormatter.format_solution(solution)
-            self.solution_text.setPlainText(formatted_solution)
+            self._set_solution_text(ResultFormatter.format_solution(solution))
         else:
-            self.solution_text.clear()
+            self._set_solution_text("")
+
+    def _set_solution_text(self, text: str) -> None:
+        """Show text, rewriting only the part after the prefix it shares with the current text"""
+        if text == self._shown_text:
+            return
+        prefix_len = len(commonprefix([self._shown_text, text]))
+        if prefix_len == 0:
+            self.solution_text.setPlainText(text)
+        else:
+            cursor = self.solution_text.textCursor()
+            cursor.setPosition(prefix_len)
+            cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(text[prefix_len:])
+        self._shown_text = text
 
     def _update_iteration_label(self) -> None:
         """Update iteration counter label"""
@@ -125,12 +176,13 @@ class ResultSection(QGroupBox):
             self.iteration_label.setText("Iteration: — / —")
             return
         
-        history_len = len(self.table_ref.get_full_history())
+        history_len = self.table_ref.history_length
         current = self.current_iteration + 1
         self.iteration_label.setText(f"Iteration: {current} / {history_len}")
 
     def _update_table(self, table: Optional[ITable]) -> None:
         """Update simplex table"""
+        self._nav_timer.stop()
         self.table_ref = table
         self.current_iteration = 0
 
@@ -149,10 +201,9 @@ class ResultSection(QGroupBox):
         """Display the next iteration"""
         if not self.table_ref:
             return
-        history = self.table_ref.get_full_history()
-        if self.current_iteration < len(history) - 1:
+        if self.current_iteration < self.table_ref.history_length - 1:
             self.current_iteration += 1
-            self.table_manager.display_iteration(self.table_ref, self.current_iteration)
+            self._nav_timer.start()
         self._update_iteration_buttons()
         self._update_iteration_label()
 
@@ -162,10 +213,15 @@ class ResultSection(QGroupBox):
             return
         if self.current_iteration > 0:
             self.current_iteration -= 1
-            self.table_manager.display_iteration(self.table_ref, self.current_iteration)
+            self._nav_timer.start()
         self._update_iteration_buttons()
         self._update_iteration_label()
     
+    def _flush_iteration(self) -> None:
+        """Render the iteration the navigation settled on"""
+        if self.table_ref:
+            self.table_manager.display_iteration(self.table_ref, self.current_iteration)
+
     def _toggle_iteration_controls(self, enable: bool) -> None:
         self.prev_btn.setEnabled(enable)
         self.next_btn.setEnabled(enable)
@@ -176,6 +232,6 @@ class ResultSection(QGroupBox):
             self._toggle_iteration_controls(False)
             return
 
-        history_len = len(self.table_ref.get_full_history())
+        history_len = self.table_ref.history_length
         self.prev_btn.setEnabled(self.current_iteration > 0)
         self.next_btn.setEnabled(self.current_iteration < history_len - 1)
\ No newline at end of file